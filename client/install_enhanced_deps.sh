@@ -12,6 +12,14 @@ pip install psutil
 echo "Installing GPUtil..."
 pip install GPUtil
 
+# Install orjson for faster payload serialization
+echo "Installing orjson..."
+pip install orjson
+
+# Install watchdog for render directory change notifications
+echo "Installing watchdog..."
+pip install watchdog
+
 # Install pynvml for NVIDIA GPU temperature monitoring
 echo "Installing pynvml for GPU temperature monitoring..."
 pip install pynvml
@@ -33,5 +41,7 @@ echo "  - CPU temperature monitoring (Linux, macOS, Windows)"
 echo "  - GPU temperature monitoring (NVIDIA, AMD, Intel)"
 echo "  - Raspberry Pi specific hardware"
 echo "  - Better fallback mechanisms"
+echo "  - Faster heartbeat payload encoding (orjson)"
+echo "  - Event-driven render directory monitoring (watchdog)"
 echo ""
 echo "You can now run the sentry client with enhanced hardware detection and temperature monitoring."
@@ -17,34 +17,34 @@ Current payload spec
 
 Temperature monitoring supports:
 - CPU: Linux (psutil), macOS (powermetrics), Windows (WMI)
-- GPU: NVIDIA (pynvml/nvidia-smi), AMD/Intel (sysfs), various fallbacks
+- GPU: NVIDIA (pynvml/nvidia-smi), AMD/Intel (sysfs), Intel Macs (powermetrics)
 """
 
-import datetime
+import atexit
+import functools
+import glob
+import importlib.util
 import json
 import os
 import platform
+import queue
 import re
+import select
+import shutil
 import socket
 import subprocess
 import sys
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from http import client as http_client
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Callable, Dict, List, Optional, Tuple
 
-# Optional imports for enhanced hardware detection
-try:
-    import psutil
-    PSUTIL_AVAILABLE = True
-except ImportError:
-    PSUTIL_AVAILABLE = False
-
-try:
-    import GPUtil
-    GPUTIL_AVAILABLE = True
-except ImportError:
-    GPUTIL_AVAILABLE = False
+# Optional modules for enhanced hardware detection. They are only used by fallback
+# probes, so just check they are installed here and import them on first use
+PSUTIL_AVAILABLE = importlib.util.find_spec("psutil") is not None
+GPUTIL_AVAILABLE = importlib.util.find_spec("GPUtil") is not None
 
 # Optional imports for temperature detection
 try:
@@ -59,43 +59,59 @@ try:
 except ImportError:
     WMI_AVAILABLE = False
 
+# Optional import for faster payload serialization
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Optional import for change notifications on the render directory (inotify/FSEvents/ReadDirectoryChangesW)
+try:
+    from watchdog.events import FileSystemEventHandler
+    from watchdog.observers import Observer
+    WATCHDOG_AVAILABLE = True
+except ImportError:
+    WATCHDOG_AVAILABLE = False
+
+# Host platform, looked up once (each platform.* call goes through uname)
+SYSTEM = platform.system()
+MACHINE = platform.machine()
+RELEASE = platform.release()
+
 # ────────────────────────────────────────────────────────────
 # 0.  Configuration ─ loading sentry_secret file
 # ────────────────────────────────────────────────────────────
+# KEY=value lines; comment lines never match, and one pair of surrounding quotes is dropped
+CONFIG_LINE_RE = re.compile(r"""^[^\S\n]*([A-Z_]+)[^\S\n]*=[^\S\n]*(["']?)(.*?)\2[^\S\n]*$""", re.M)
+
 def load_sentry_config() -> Dict[str, str]:
     """
     Load configuration from sentry_secret file.
-    Returns a dictionary with SERVER_HOST, SERVER_PORT, and SENTRY_SECRET.
+    Returns a dictionary with SERVER_HOST, SERVER_PORT, SENTRY_SECRET and TEMP_POLL_INTERVAL.
     """
     config = {
         "SERVER_HOST": "localhost",
         "SERVER_PORT": "3000", 
-        "SENTRY_SECRET": None
+        "SENTRY_SECRET": None,
+        "TEMP_POLL_INTERVAL": "10"
     }
     
     # Look for sentry_secret file in the same directory as this script
     script_dir = os.path.dirname(os.path.abspath(__file__))
     secret_file = os.path.join(script_dir, "sentry_secret")
     
-    if not os.path.exists(secret_file):
+    try:
+        for key, _, value in CONFIG_LINE_RE.findall(Path(secret_file).read_text()):
+            if key in config:
+                config[key] = value
+    except FileNotFoundError:
         print(f"❌ Error: sentry_secret file not found at {secret_file}")
         print("Please create a sentry_secret file with the following format:")
         print("SERVER_HOST=your-server-host")
         print("SERVER_PORT=your-server-port")
         print("SENTRY_SECRET=your-magic-string")
         exit(1)
-    
-    try:
-        with open(secret_file, 'r') as f:
-            for line in f:
-                line = line.strip()
-                if line and not line.startswith('#'):
-                    if '=' in line:
-                        key, value = line.split('=', 1)
-                        key = key.strip()
-                        value = value.strip()
-                        if key in config:
-                            config[key] = value
     except Exception as e:
         print(f"❌ Error reading sentry_secret file: {e}")
         exit(1)
@@ -104,6 +120,15 @@ def load_sentry_config() -> Dict[str, str]:
         print("❌ Error: SENTRY_SECRET not found in sentry_secret file")
         exit(1)
     
+    try:
+        temp_poll_interval = float(config["TEMP_POLL_INTERVAL"])
+    except ValueError:
+        temp_poll_interval = None
+    # Rejects NaN and inf as well as zero and negative values
+    if temp_poll_interval is None or not 0 < temp_poll_interval < float('inf'):
+        print(f"❌ Error: TEMP_POLL_INTERVAL must be a positive number of seconds, got '{config['TEMP_POLL_INTERVAL']}'")
+        exit(1)
+    
     return config
 
 # Load configuration at startup
@@ -164,6 +189,10 @@ def get_user_input() -> Tuple[str, int, int]:
     
     return str(render_path), start_frame, end_frame
 
+# Frame number: 2-10 digits at the end of the name, otherwise the first
+# 2-10 digit run followed by a separator (checked in that order)
+FRAME_NUMBER_RE = re.compile(r'^(?:.*?(\d{2,10})$|.*?(\d{2,10})[._-])', re.S)
+
 def extract_frame_number(filename: str) -> Optional[int]:
     """
     Extract frame number from filename.
@@ -173,39 +202,38 @@ def extract_frame_number(filename: str) -> Optional[int]:
     # Remove file extension
     name_without_ext = os.path.splitext(filename)[0]
     
-    # Pattern to match frame numbers at the end of filename
-    # Supports 2-10 digit padding with optional separators
-    patterns = [
-        r'(\d{2,10})$',  # 2-10 digits at the end
-        r'[._-](\d{2,10})$',  # 2-10 digits after separator
-        r'(\d{2,10})[._-]',  # 2-10 digits before separator at end
-    ]
-    
-    for pattern in patterns:
-        match = re.search(pattern, name_without_ext)
-        if match:
-            try:
-                return int(match.group(1))
-            except ValueError:
-                continue
+    match = FRAME_NUMBER_RE.match(name_without_ext)
+    if match:
+        return int(match.group(match.lastindex))
     
     return None
 
-def get_render_files(render_dir: str, start_frame: int, end_frame: int) -> List[Tuple[str, int, float]]:
+def get_render_files(render_dir: str, start_frame: int, end_frame: int,
+                     frame_cache: Optional[Dict[str, Optional[int]]] = None) -> List[Tuple[str, int, float]]:
     """
     Get all render files in the directory with their frame numbers and modification times.
     Returns list of (filename, frame_number, mtime) tuples.
+    If frame_cache is given, frame numbers already parsed for a filename are reused,
+    and the cache is pruned/extended to match the current directory contents.
     """
-    render_path = Path(render_dir)
-    if not render_path.exists():
+    files = []
+    seen = {}
+    try:
+        with os.scandir(render_dir) as entries:
+            for entry in entries:
+                if frame_cache is not None and entry.name in frame_cache:
+                    frame_num = frame_cache[entry.name]
+                else:
+                    frame_num = extract_frame_number(entry.name)
+                seen[entry.name] = frame_num
+                if frame_num is not None and start_frame <= frame_num <= end_frame and entry.is_file():
+                    files.append((entry.name, frame_num, entry.stat().st_mtime))
+    except FileNotFoundError:
         return []
     
-    files = []
-    for file_path in render_path.iterdir():
-        if file_path.is_file():
-            frame_num = extract_frame_number(file_path.name)
-            if frame_num is not None and start_frame <= frame_num <= end_frame:
-                files.append((file_path.name, frame_num, file_path.stat().st_mtime))
+    if frame_cache is not None:
+        frame_cache.clear()
+        frame_cache.update(seen)
     
     # Sort by frame number
     files.sort(key=lambda x: x[1])
@@ -218,7 +246,7 @@ def determine_node_status(render_progress: Dict[str, any], last_frame_count: int
     """
     total_frames = render_progress['total_frames']
     rendered_frames = render_progress['rendered_frames']
-    frame_delta_time = render_progress['frame_delta_time']
+    frame_delta_seconds = render_progress['frame_delta_seconds']
     
     # If no frames have been rendered yet, it's idling
     if rendered_frames == 0:
@@ -229,31 +257,13 @@ def determine_node_status(render_progress: Dict[str, any], last_frame_count: int
         return 'idling'
     
     # If we have a frame delta time, check if we're overdue for a new frame
-    if frame_delta_time:
-        try:
-            # Parse the delta time string (format: "H:MM:SS" or "MM:SS")
-            delta_parts = frame_delta_time.split(':')
-            if len(delta_parts) == 3:  # H:MM:SS
-                hours, minutes, seconds = map(int, delta_parts)
-                delta_seconds = hours * 3600 + minutes * 60 + seconds
-            elif len(delta_parts) == 2:  # MM:SS
-                minutes, seconds = map(int, delta_parts)
-                delta_seconds = minutes * 60 + seconds
-            else:
-                # Fallback: assume it's just seconds
-                delta_seconds = int(delta_parts[0])
-            
-            # Check if we're overdue (4x the known delta time)
-            time_since_last_post = current_time - last_post_time
-            expected_next_frame_time = delta_seconds * 4
-            
-            if time_since_last_post > expected_next_frame_time:
-                return 'needs attention'
-        except (ValueError, IndexError):
-            # If we can't parse the delta time, fall back to a simple check
-            time_since_last_post = current_time - last_post_time
-            if time_since_last_post > 300:  # 5 minutes without activity
-                return 'needs attention'
+    if frame_delta_seconds is not None:
+        # Check if we're overdue (4x the known delta time)
+        time_since_last_post = current_time - last_post_time
+        expected_next_frame_time = frame_delta_seconds * 4
+        
+        if time_since_last_post > expected_next_frame_time:
+            return 'needs attention'
     
     # If we have new frames since last check, we're actively rendering
     if rendered_frames > last_frame_count:
@@ -267,21 +277,184 @@ def determine_node_status(render_progress: Dict[str, any], last_frame_count: int
     # Default to rendering if we're in progress
     return 'rendering'
 
-def get_render_progress(render_dir: str, start_frame: int, end_frame: int) -> Dict[str, any]:
+# Last render directory scan, reused while the directory has not changed
+_RENDER_SCAN = {
+    "key": None,            # (render_dir, start_frame, end_frame) the scan belongs to
+    "dir_mtime_ns": None,   # directory mtime when it was scanned
+    "latest_path": None,    # newest frame file and its mtime, to catch in-progress writes
+    "latest_mtime_ns": None,
+    "frame_cache": {},      # filename -> parsed frame number (None if not a frame)
+    "progress": None,
+}
+# A directory mtime newer than this is not trusted: filesystems with coarse
+# timestamps may not bump it again for a file created right after the scan
+DIR_MTIME_SETTLE_NS = 2_000_000_000
+MAX_MISSING_FRAMES = 10  # Only report the first few missing frames
+
+# Render directory watcher; while it runs, the directory is rescanned after it reports a change,
+# and otherwise only re-checked (by mtime) on the regular update in case events were missed
+_RENDER_WATCH = {
+    "dir": None,            # render_dir being watched
+    "observer": None,
+}
+_RENDER_DIR_CHANGED = threading.Event()
+# Wakes the monitor loop before its next scheduled check: set when the watched render
+# directory changes and when the poster gets an answer for a heartbeat
+_MONITOR_WAKE = threading.Event()
+
+if WATCHDOG_AVAILABLE:
+    class _RenderDirEventHandler(FileSystemEventHandler):
+        """Flag the render directory as changed on any create/modify/move/delete event."""
+        
+        def on_any_event(self, event):
+            _RENDER_DIR_CHANGED.set()
+            _MONITOR_WAKE.set()
+
+def start_render_dir_watcher(render_dir: str) -> bool:
+    """
+    Start watching render_dir for changes, if watchdog is installed.
+    Returns False (and the caller keeps polling) if the watch can't be set up. A watch on a
+    network filesystem may set up fine yet miss files written by other hosts; the mtime
+    check on each regular update covers that.
+    """
+    if not WATCHDOG_AVAILABLE:
+        return False
+    stop_render_dir_watcher()
+    try:
+        observer = Observer()
+        observer.daemon = True
+        observer.schedule(_RenderDirEventHandler(), render_dir, recursive=False)
+        observer.start()
+    except Exception:
+        return False
+    # Force one full scan so the cache matches the directory as of the watch start
+    _RENDER_DIR_CHANGED.set()
+    _RENDER_WATCH.update({"dir": render_dir, "observer": observer})
+    return True
+
+def stop_render_dir_watcher():
+    """Stop the render directory watcher, falling back to polling."""
+    observer = _RENDER_WATCH["observer"]
+    _RENDER_WATCH.update({"dir": None, "observer": None})
+    if observer is not None:
+        try:
+            observer.stop()
+        except Exception:
+            pass
+
+atexit.register(stop_render_dir_watcher)
+
+def _render_dir_watcher_alive() -> bool:
+    """Check that the watcher's observer and emitter threads are still running."""
+    observer = _RENDER_WATCH["observer"]
+    if observer is None or not observer.is_alive():
+        return False
+    return all(emitter.is_alive() for emitter in observer.emitters)
+
+def _render_scan_is_current(key: Tuple[str, int, int], dir_mtime_ns: int) -> bool:
+    """Check whether the cached scan still describes the render directory."""
+    if _RENDER_SCAN["key"] != key or _RENDER_SCAN["dir_mtime_ns"] != dir_mtime_ns:
+        return False
+    if time.time_ns() - dir_mtime_ns < DIR_MTIME_SETTLE_NS:
+        return False
+    if _RENDER_SCAN["latest_path"] is not None:
+        try:
+            if os.stat(_RENDER_SCAN["latest_path"]).st_mtime_ns != _RENDER_SCAN["latest_mtime_ns"]:
+                return False
+        except OSError:
+            return False
+    return True
+
+def get_render_progress(render_dir: str, start_frame: int, end_frame: int, verify: bool = False) -> Dict[str, any]:
     """
     Get current render progress information.
     Returns dictionary with progress stats including delta time between last two frames.
+    The directory is only rescanned when the watcher reports a change or, when polling
+    (or when verify is set while watching), when its mtime (or the newest frame's mtime) changes.
+    """
+    key = (render_dir, start_frame, end_frame)
+    watched = _RENDER_WATCH["dir"] == render_dir
+    if watched and not _render_dir_watcher_alive():
+        # The watcher died (e.g. the filesystem was unmounted); poll from now on
+        stop_render_dir_watcher()
+        watched = False
+    changed = watched and (_RENDER_SCAN["key"] != key or _RENDER_DIR_CHANGED.is_set())
+    if watched:
+        if not changed and not verify:
+            return _RENDER_SCAN["progress"]
+        if changed:
+            # Clear before scanning so changes made during the scan trigger another one
+            _RENDER_DIR_CHANGED.clear()
+    
+    try:
+        dir_mtime_ns = os.stat(render_dir).st_mtime_ns
+    except OSError:
+        dir_mtime_ns = None
+    
+    if watched and dir_mtime_ns is None:
+        # The watched directory is gone; poll so a recreated directory is picked up
+        stop_render_dir_watcher()
+    elif not changed and dir_mtime_ns is not None and _render_scan_is_current(key, dir_mtime_ns):
+        return _RENDER_SCAN["progress"]
+    
+    if _RENDER_SCAN["key"] != key:
+        _RENDER_SCAN["frame_cache"] = {}
+    files = get_render_files(render_dir, start_frame, end_frame, _RENDER_SCAN["frame_cache"])
+    progress = _compute_render_progress(files, start_frame, end_frame)
+    
+    latest_path = None
+    latest_mtime_ns = None
+    if files:
+        latest_path = os.path.join(render_dir, files[-1][0])
+        try:
+            latest_mtime_ns = os.stat(latest_path).st_mtime_ns
+        except OSError:
+            pass
+    
+    _RENDER_SCAN.update({
+        "key": key,
+        "dir_mtime_ns": dir_mtime_ns,
+        "latest_path": latest_path,
+        "latest_mtime_ns": latest_mtime_ns,
+        "progress": progress,
+    })
+    return progress
+
+def _first_missing_frames(files: List[Tuple[str, int, float]], start_frame: int, total_frames: int) -> List[int]:
     """
-    files = get_render_files(render_dir, start_frame, end_frame)
+    Return the first MAX_MISSING_FRAMES frame numbers in the range with no file.
+    Rendered frames are kept as bits of one integer, so the range itself is never walked.
+    """
+    if total_frames <= 0:
+        return []
+    rendered_mask = 0
+    for _, frame, _ in files:
+        rendered_mask |= 1 << (frame - start_frame)
+    missing_mask = ((1 << total_frames) - 1) & ~rendered_mask
+    
+    missing_frames = []
+    while missing_mask and len(missing_frames) < MAX_MISSING_FRAMES:
+        lowest_bit = missing_mask & -missing_mask
+        missing_frames.append(start_frame + lowest_bit.bit_length() - 1)
+        missing_mask ^= lowest_bit
+    return missing_frames
+
+def _compute_render_progress(files: List[Tuple[str, int, float]], start_frame: int, end_frame: int) -> Dict[str, any]:
+    """
+    Build the progress dictionary from a sorted list of render files.
+    """
+    total_frames = end_frame - start_frame + 1
+    missing_frames = _first_missing_frames(files, start_frame, total_frames)
     
     if not files:
         return {
-            "total_frames": end_frame - start_frame + 1,
+            "total_frames": total_frames,
             "rendered_frames": 0,
             "progress_percentage": 0.0,
             "latest_frame": None,
             "frame_delta_time": None,
-            "missing_frames": list(range(start_frame, end_frame + 1))
+            "frame_delta_seconds": None,
+            "missing_frames": missing_frames
         }
     
     # Get latest frame info
@@ -289,18 +462,19 @@ def get_render_progress(render_dir: str, start_frame: int, end_frame: int) -> Di
     
     # Calculate delta time between last two frames
     frame_delta_time = None
+    frame_delta_seconds = None
     if len(files) >= 2:
         # Get the second-to-last frame
         second_last_file, second_last_frame, second_last_mtime = files[-2]
-        delta_seconds = latest_mtime - second_last_mtime
-        frame_delta_time = str(datetime.timedelta(seconds=int(delta_seconds)))
-    
-    # Find missing frames
-    rendered_frames = {frame for _, frame, _ in files}
-    missing_frames = [frame for frame in range(start_frame, end_frame + 1) if frame not in rendered_frames]
+        delta_seconds = int(latest_mtime - second_last_mtime)
+        # Frames written out of order give a negative delta, which says nothing useful
+        if delta_seconds >= 0:
+            hours, remainder = divmod(delta_seconds, 3600)
+            minutes, seconds = divmod(remainder, 60)
+            frame_delta_time = f"{hours}:{minutes:02d}:{seconds:02d}"
+            frame_delta_seconds = delta_seconds
     
     # Calculate progress
-    total_frames = end_frame - start_frame + 1
     rendered_count = len(files)
     progress_percentage = (rendered_count / total_frames) * 100
     
@@ -310,25 +484,130 @@ def get_render_progress(render_dir: str, start_frame: int, end_frame: int) -> Di
         "progress_percentage": round(progress_percentage, 1),
         "latest_frame": latest_frame,
         "frame_delta_time": frame_delta_time,
-        "missing_frames": missing_frames[:10] if len(missing_frames) > 10 else missing_frames  # Limit to first 10
+        "frame_delta_seconds": frame_delta_seconds,
+        "missing_frames": missing_frames
     }
 
 # ────────────────────────────────────────────────────────────
 # 0.5. Rolling Display Functions
 # ────────────────────────────────────────────────────────────
+# ANSI sequence to move the cursor home and clear the screen
+CLEAR_SCREEN = "\x1b[H\x1b[2J"
+
+if os.name == 'nt':
+    # Enable ANSI escape processing in the Windows console
+    os.system('')
+
+# Last screen drawn and the notice rows printed under it, so the next redraw
+# only rewrites the rows that changed
+_SCREEN = {"lines": None, "size": None, "notes": 0}
+
+def _write_screen(lines: List[str]):
+    """
+    Draw the status block at the top of the terminal.
+    If the previous block is still on screen unchanged in shape, only rows whose text
+    changed are rewritten; otherwise the screen is cleared and redrawn.
+    """
+    size = shutil.get_terminal_size()
+    # Rows are addressed absolutely, so every line must fit without wrapping
+    # (+2 columns for wide emoji) and the block must not scroll
+    fits = len(lines) < size.lines and all(len(line) + 2 < size.columns for line in lines)
+    previous = _SCREEN["lines"]
+    
+    if not fits or previous is None or len(previous) != len(lines) or _SCREEN["size"] != size:
+        output = CLEAR_SCREEN + "\n".join(lines) + "\n"
+    else:
+        parts = [f"\x1b[{row};1H\x1b[2K{line}"
+                 for row, (old, line) in enumerate(zip(previous, lines), 1) if old != line]
+        # Park the cursor below the block and clear notices printed since the last redraw
+        parts.append(f"\x1b[{len(lines) + 1};1H\x1b[J")
+        output = "".join(parts)
+    
+    _SCREEN.update({"lines": lines if fits else None, "size": size, "notes": 0})
+    sys.stdout.write(output)
+    sys.stdout.flush()
+
+def _write_notes(notes: List[str]):
+    """Print notices below the status block."""
+    sys.stdout.write("".join(f"{note}\n" for note in notes))
+    sys.stdout.flush()
+    if _SCREEN["lines"] is not None:
+        _SCREEN["notes"] += sum(note.count("\n") + 1 for note in notes)
+        # Once the notices reach the bottom row the terminal scrolls and the block's rows shift
+        if len(_SCREEN["lines"]) + _SCREEN["notes"] >= _SCREEN["size"].lines:
+            _SCREEN["lines"] = None
+
+# Screens and notices are written by a background thread so a paused (Ctrl-S) or
+# slow terminal never holds up the monitor loop; only the newest screen is kept
+_DISPLAY_PENDING = {"lines": None, "notes": []}
+_DISPLAY_READY = threading.Condition()
+_DISPLAY_THREAD: Optional[threading.Thread] = None
+
+def _display_writer():
+    """Write queued screens and notices to the terminal, in order."""
+    while True:
+        with _DISPLAY_READY:
+            while _DISPLAY_PENDING["lines"] is None and not _DISPLAY_PENDING["notes"]:
+                _DISPLAY_READY.wait()
+            lines, notes = _DISPLAY_PENDING["lines"], _DISPLAY_PENDING["notes"]
+            _DISPLAY_PENDING.update({"lines": None, "notes": []})
+        if lines is not None:
+            _write_screen(lines)
+        if notes:
+            _write_notes(notes)
+
+def _queue_display(lines: Optional[List[str]] = None, note: Optional[str] = None):
+    """Hand a screen and/or a notice to the display thread without waiting for the terminal."""
+    global _DISPLAY_THREAD
+    with _DISPLAY_READY:
+        if _DISPLAY_THREAD is None:
+            _DISPLAY_THREAD = threading.Thread(target=_display_writer, name="display", daemon=True)
+            _DISPLAY_THREAD.start()
+        if lines is not None:
+            # A new screen clears everything below it, so notices not yet shown go with the old one
+            _DISPLAY_PENDING.update({"lines": lines, "notes": []})
+        if note is not None:
+            _DISPLAY_PENDING["notes"].append(note)
+        _DISPLAY_READY.notify()
+
+def show_notice(message: str):
+    """Print a notice below the status display; the next redraw clears it."""
+    _queue_display(note=message)
+
+# Masked secret for the display, computed once
+SECRET_MASK = '*' * len(SENTRY_CONFIG["SENTRY_SECRET"])
+
+@functools.lru_cache(maxsize=1)
+def _status_header(server_host, server_port, hardware_summary) -> Tuple[str, ...]:
+    """Top lines of the status display, which stay the same between redraws."""
+    return (
+        "🎬 Mata Sentry Render Monitor - Press Ctrl-C to quit",
+        "=" * 60,
+        f"📡 Server: {server_host}:{server_port}",
+        f"🔐 Auth: {SECRET_MASK}",
+        f"🖥️  Hardware: {hardware_summary}",
+    )
+
+@functools.lru_cache(maxsize=1)
+def _dependency_warnings(psutil_available, gputil_available, pynvml_available, wmi_available) -> Tuple[str, ...]:
+    """Warnings for missing optional modules, rebuilt only if an availability flag changes."""
+    warnings = []
+    if not psutil_available:
+        warnings.append("⚠️  psutil not available - install with 'pip install psutil' for enhanced CPU detection")
+    if not gputil_available:
+        warnings.append("⚠️  GPUtil not available - install with 'pip install gputil' for enhanced GPU detection")
+    if not pynvml_available:
+        warnings.append("⚠️  pynvml not available - install with 'pip install nvidia-ml-py3' for GPU temperature monitoring")
+    if not wmi_available:
+        warnings.append("⚠️  wmi not available - install with 'pip install WMI' for Windows temperature monitoring")
+    return tuple(warnings)
+
 def clear_and_redraw_status(server_host, server_port, hardware_summary, last_status, last_timestamp, render_progress=None, render_dir=None, start_frame=None, end_frame=None, node_status="idling"):
     """
-    Clear the console and redraw the client status display.
+    Redraw the client status display, rewriting only the lines that changed.
     """
-    # Clear the console (works on most terminals)
-    os.system('clear' if os.name == 'posix' else 'cls')
-    
-    # Redraw the status
-    print("🎬 Mata Sentry Render Monitor - Press Ctrl-C to quit")
-    print("=" * 60)
-    print(f"📡 Server: {server_host}:{server_port}")
-    print(f"🔐 Auth: {'*' * len(SENTRY_CONFIG['SENTRY_SECRET'])}")
-    print(f"🖥️  Hardware: {hardware_summary}")
+    # Build the whole screen first so it goes out in a single write
+    lines = list(_status_header(server_host, server_port, hardware_summary))
     
     # Show node status
     status_icons = {
@@ -337,176 +616,335 @@ def clear_and_redraw_status(server_host, server_port, hardware_summary, last_sta
         "needs attention": "⚠️"
     }
     status_icon = status_icons.get(node_status, "❓")
-    print(f"📊 Node Status: {status_icon} {node_status.upper()}")
+    lines.append(f"📊 Node Status: {status_icon} {node_status.upper()}")
     
     # Show render monitoring info
     if render_dir and start_frame is not None and end_frame is not None:
-        print(f"📁 Monitoring: {render_dir}")
-        print(f"🎬 Frame Range: {start_frame}-{end_frame}")
+        lines.append(f"📁 Monitoring: {render_dir}")
+        lines.append(f"🎬 Frame Range: {start_frame}-{end_frame}")
         
         if render_progress:
             progress = render_progress
-            print(f"📊 Progress: {progress['rendered_frames']}/{progress['total_frames']} frames ({progress['progress_percentage']}%)")
+            lines.append(f"📊 Progress: {progress['rendered_frames']}/{progress['total_frames']} frames ({progress['progress_percentage']}%)")
             
             if progress['latest_frame'] is not None:
                 frame_info = f"Latest Frame: {progress['latest_frame']}"
                 if progress['frame_delta_time']:
                     frame_info += f" (Δ: {progress['frame_delta_time']})"
-                print(f"🎯 {frame_info}")
+                lines.append(f"🎯 {frame_info}")
             else:
-                print("🎯 Latest Frame: None (no frames rendered yet)")
+                lines.append("🎯 Latest Frame: None (no frames rendered yet)")
             
             if progress['missing_frames']:
                 missing_str = str(progress['missing_frames'])[:50]
-                if len(progress['missing_frames']) > 10:
+                missing_count = progress['total_frames'] - progress['rendered_frames']
+                if missing_count > len(progress['missing_frames']):
                     missing_str += "..."
-                print(f"⏳ Missing: {missing_str}")
+                lines.append(f"⏳ Missing: {missing_str}")
     
     # Show optional dependency status
-    if not PSUTIL_AVAILABLE:
-        print("⚠️  psutil not available - install with 'pip install psutil' for enhanced CPU detection")
-    if not GPUTIL_AVAILABLE:
-        print("⚠️  GPUtil not available - install with 'pip install gputil' for enhanced GPU detection")
-    if not PYNVML_AVAILABLE:
-        print("⚠️  pynvml not available - install with 'pip install nvidia-ml-py3' for GPU temperature monitoring")
-    if not WMI_AVAILABLE:
-        print("⚠️  wmi not available - install with 'pip install WMI' for Windows temperature monitoring")
-    print('')  # Empty line
+    lines.extend(_dependency_warnings(PSUTIL_AVAILABLE, GPUTIL_AVAILABLE, PYNVML_AVAILABLE, WMI_AVAILABLE))
+    lines.append('')  # Empty line
     
     # Display current status
-    if last_status and last_timestamp:
+    if last_status == POST_PENDING:
+        # Not answered yet rather than failed; the status text carries its own ⏳ icon
+        lines.append(f"📡 Server Status: {last_status} at {last_timestamp}")
+    elif last_status and last_timestamp:
         status_icon = "✅" if "200" in last_status else "❌"
-        print(f"📡 Server Status: {status_icon} {last_status} at {last_timestamp}")
+        lines.append(f"📡 Server Status: {status_icon} {last_status} at {last_timestamp}")
     else:
-        print("📡 Server Status: Waiting for first update...")
+        lines.append("📡 Server Status: Waiting for first update...")
+    
+    _queue_display(lines=lines)
 
 # ────────────────────────────────────────────────────────────
 # 1.  Helpers ─ gathering node information
 # ────────────────────────────────────────────────────────────
 def iso_timestamp() -> str:
     """UTC timestamp in ISO-8601 with trailing Z (no microseconds)."""
-    return datetime.datetime.now(datetime.timezone.utc).replace(microsecond=0).isoformat().replace('+00:00', 'Z')
+    return time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())
 
 
+@functools.lru_cache(maxsize=1)
 def get_hostname() -> str:
     return socket.gethostname()
 
 
-def is_vcgencmd_available() -> bool:
+def _import_psutil():
     """
-    Check if vcgencmd is available (Raspberry Pi OS only).
+    Import psutil on first use. Returns None if it isn't installed or fails to import,
+    in which case PSUTIL_AVAILABLE is cleared so the import isn't retried.
+    """
+    global PSUTIL_AVAILABLE
+    if PSUTIL_AVAILABLE:
+        try:
+            import psutil
+            return psutil
+        except ImportError:
+            PSUTIL_AVAILABLE = False
+    return None
+
+
+# Read-only descriptors for procfs/sysfs files that are read more than once
+_PERSISTENT_FDS: Dict[str, int] = {}
+
+def read_persistent_file(path: str, limit: Optional[int] = None) -> str:
+    """
+    Read a procfs/sysfs file through a descriptor that stays open across calls.
+    Pass limit to read at most that many bytes with a single pread.
+    Raises OSError if the file cannot be opened or read.
+    """
+    fd = _PERSISTENT_FDS.get(path)
+    if fd is None:
+        new_fd = os.open(path, os.O_RDONLY)
+        # Startup probes run in parallel; keep whichever descriptor was stored first
+        fd = _PERSISTENT_FDS.setdefault(path, new_fd)
+        if fd != new_fd:
+            os.close(new_fd)
+    
+    if limit is not None:
+        return os.pread(fd, limit, 0).decode(errors="replace")
+    
+    chunks = []
+    offset = 0
+    while True:
+        chunk = os.pread(fd, 65536, offset)
+        if not chunk:
+            break
+        chunks.append(chunk)
+        offset += len(chunk)
+    return b"".join(chunks).decode(errors="replace")
+
+def _close_persistent_files():
+    """Close every descriptor opened by read_persistent_file."""
+    for fd in _PERSISTENT_FDS.values():
+        try:
+            os.close(fd)
+        except OSError:
+            pass
+    _PERSISTENT_FDS.clear()
+
+atexit.register(_close_persistent_files)
+
+
+@functools.lru_cache(maxsize=1)
+def read_cpuinfo() -> str:
+    """
+    Return the contents of /proc/cpuinfo, read once per process.
+    procfs regenerates the file on every read call, which gets slow on many-core hosts.
+    """
+    return Path("/proc/cpuinfo").read_text(errors="replace")
+
+@functools.lru_cache(maxsize=1)
+def parse_cpuinfo() -> Dict[str, any]:
     """
+    Pull everything the CPU and GPU probes need out of /proc/cpuinfo in one pass.
+    Returns {"model": first 'model name' or None, "is_arm": bool,
+             "arm_name": name from the first model name/Processor/Hardware/CPU architecture line, or None}.
+    """
+    cpuinfo = read_cpuinfo()
+    lowered = cpuinfo.lower()
+    info = {"model": None, "is_arm": "arm" in lowered or "aarch64" in lowered, "arm_name": None}
+    for line in cpuinfo.split("\n"):
+        key, _, value = line.partition(":")
+        value = value.strip()
+        if not value:
+            continue
+        if line.startswith("model name"):
+            if info["model"] is None and key.strip() == "model name":
+                info["model"] = value
+            arm_name = value
+        elif line.startswith("Processor"):
+            arm_name = value
+        elif line.startswith("Hardware") or line.startswith("CPU architecture"):
+            arm_name = f"ARM {value}"
+        else:
+            continue
+        if info["arm_name"] is None:
+            info["arm_name"] = arm_name
+        if info["model"] is not None:
+            break
+    return info
+
+
+PROBE_TIMEOUT = 5  # Seconds before a hardware probe command is abandoned
+# Probe commands that failed or timed out; they are not run again
+_FAILED_PROBES = set()
+# Output of probe commands that succeeded, so probes sharing a command (e.g. lspci) run it once
+_PROBE_OUTPUTS: Dict[Tuple[str, ...], str] = {}
+
+# Absolute paths of the external tools used for probing (None if not installed),
+# resolved once so missing tools are skipped without a fork
+PROBE_TOOLS = {
+    name: shutil.which(name)
+    for name in ("sw_vers", "sysctl", "system_profiler", "ioreg", "lscpu", "dmidecode", "lspci",
+                 "nvidia-smi", "glxinfo", "vcgencmd", "wmic")
+}
+
+def run_probe(cmd: List[str], **kwargs) -> str:
+    """
+    Run a hardware probe command with a timeout and return its text output.
+    The command's stderr is discarded so probe noise doesn't land on the status display.
+    Each command runs at most once: later calls return the saved output, or
+    raise immediately if it failed.
+    """
+    key = tuple(cmd)
+    if key in _PROBE_OUTPUTS:
+        return _PROBE_OUTPUTS[key]
+    if key in _FAILED_PROBES:
+        raise subprocess.SubprocessError(f"{cmd[0]} probe failed previously")
+    
+    tool = PROBE_TOOLS[cmd[0]] if cmd[0] in PROBE_TOOLS else shutil.which(cmd[0])
+    if tool is None:
+        raise FileNotFoundError(f"{cmd[0]} not found")
     try:
-        subprocess.check_output(["vcgencmd", "commands"], text=True, stderr=subprocess.DEVNULL)
-        return True
+        kwargs.setdefault("stderr", subprocess.DEVNULL)
+        output = subprocess.check_output([tool, *cmd[1:]], text=True, timeout=PROBE_TIMEOUT, **kwargs)
     except Exception:
-        return False
+        _FAILED_PROBES.add(key)
+        raise
+    _PROBE_OUTPUTS[key] = output
+    return output
+
+
+@functools.lru_cache(maxsize=1)
+def is_vcgencmd_available() -> bool:
+    """
+    Check if vcgencmd is available (Raspberry Pi OS only).
+    """
+    return PROBE_TOOLS["vcgencmd"] is not None
 
+@functools.lru_cache(maxsize=1)
 def get_os_string() -> str:
     """
     Return OS string like 'macOS 15.6.1 arm64'.
     Falls back to platform.system/release/architecture if sw_vers is missing.
     """
-    if platform.system() == "Darwin":
+    if SYSTEM == "Darwin":
+        # mac_ver() reads SystemVersion.plist, so sw_vers is only spawned if that fails
+        product = platform.mac_ver()[0]
+        if product:
+            return f"macOS {product} {MACHINE}"
         try:
             product = (
-                subprocess.check_output(["sw_vers", "-productVersion"], text=True)
+                run_probe(["sw_vers", "-productVersion"])
                 .strip()
             )
-            arch = platform.machine()
-            return f"macOS {product} {arch}"
+            return f"macOS {product} {MACHINE}"
         except Exception:
             pass  # fall back below
     # Generic fallback
-    return f"{platform.system()} {platform.release()} {platform.machine()}"
+    return f"{SYSTEM} {RELEASE} {MACHINE}"
 
 
-def get_cpu_name() -> str:
+def _sysctl_string(name: str) -> Optional[str]:
     """
-    Enhanced CPU detection with support for multiple platforms.
-    Tries platform-specific methods first, then falls back to generic methods.
+    Read a string sysctl value through libc's sysctlbyname (macOS), without spawning sysctl.
+    Returns None if the call fails.
     """
-    system = platform.system()
-    
-    # macOS - use sysctl
-    if system == "Darwin":
-        try:
-            return (
-                subprocess.check_output(["sysctl", "-n", "machdep.cpu.brand_string"],
-                                        text=True)
-                .strip()
-            )
-        except Exception:
-            pass
+    try:
+        import ctypes
+        libc = ctypes.CDLL("libc.dylib", use_errno=True)
+        key = name.encode()
+        size = ctypes.c_size_t(0)
+        # The first call only reports the buffer size needed
+        if libc.sysctlbyname(key, None, ctypes.byref(size), None, 0) != 0:
+            return None
+        buf = ctypes.create_string_buffer(size.value)
+        if libc.sysctlbyname(key, buf, ctypes.byref(size), None, 0) != 0:
+            return None
+        return buf.value.decode(errors="replace").strip() or None
+    except (OSError, AttributeError):
+        return None
+
+def _cpu_name_darwin() -> Optional[str]:
+    """CPU brand string from sysctlbyname, falling back to the sysctl tool (macOS)."""
+    cpu_name = _sysctl_string("machdep.cpu.brand_string")
+    if cpu_name:
+        return cpu_name
+    try:
+        return (
+            run_probe(["sysctl", "-n", "machdep.cpu.brand_string"])
+            .strip()
+        )
+    except Exception:
+        pass
+    return None
+
+def _cpu_name_linux() -> Optional[str]:
+    """CPU model from /proc/cpuinfo, lscpu or dmidecode, with ARM/Raspberry Pi fallbacks (Linux)."""
+    # Try /proc/cpuinfo first (most reliable on Linux)
+    try:
+        cpu_model = parse_cpuinfo()["model"]
+        if cpu_model:
+            return cpu_model
+    except Exception:
+        pass
     
-    # Linux - try multiple methods
-    elif system == "Linux":
-        # Try /proc/cpuinfo first (most reliable on Linux)
-        try:
-            with open("/proc/cpuinfo", "r") as f:
-                for line in f:
-                    if line.startswith("model name"):
-                        return line.split(":")[1].strip()
-        except Exception:
-            pass
-        
-        # Try lscpu command
-        try:
-            result = subprocess.check_output(["lscpu"], text=True)
-            for line in result.split("\n"):
-                if "Model name:" in line:
-                    return line.split(":")[1].strip()
-        except Exception:
-            pass
-        
-        # Try dmidecode (if available)
-        try:
-            result = subprocess.check_output(["dmidecode", "-t", "processor"], text=True)
-            for line in result.split("\n"):
-                if "Version:" in line and "Not Specified" not in line:
-                    return line.split(":")[1].strip()
-        except Exception:
-            pass
+    # Try lscpu command
+    try:
+        result = run_probe(["lscpu"])
+        for line in result.split("\n"):
+            if "Model name:" in line:
+                return line.split(":")[1].strip()
+    except Exception:
+        pass
     
-    # Windows - try wmic
-    elif system == "Windows":
-        try:
-            result = subprocess.check_output(
-                ["wmic", "cpu", "get", "name", "/value"], 
-                text=True, 
-                creationflags=subprocess.CREATE_NO_WINDOW
-            )
-            for line in result.split("\n"):
-                if line.startswith("Name="):
-                    return line.split("=", 1)[1].strip()
-        except Exception:
-            pass
+    # Try dmidecode (if available)
+    try:
+        result = run_probe(["dmidecode", "-t", "processor"])
+        for line in result.split("\n"):
+            if "Version:" in line and "Not Specified" not in line:
+                return line.split(":")[1].strip()
+    except Exception:
+        pass
     
     # ARM-specific detection (including Raspberry Pi)
-    if system == "Linux":
-        try:
-            with open("/proc/cpuinfo", "r") as f:
-                cpuinfo = f.read()
-                if "arm" in cpuinfo.lower() or "aarch64" in cpuinfo.lower():
-                    # Try to get specific ARM processor info
-                    for line in cpuinfo.split("\n"):
-                        if line.startswith("model name") or line.startswith("Processor"):
-                            processor = line.split(":")[1].strip()
-                            if processor and processor != "":
-                                return processor
-                        elif line.startswith("Hardware"):
-                            hardware = line.split(":")[1].strip()
-                            if hardware and hardware != "":
-                                return f"ARM {hardware}"
-                        elif line.startswith("CPU architecture"):
-                            arch = line.split(":")[1].strip()
-                            if arch and arch != "":
-                                return f"ARM {arch}"
-        except Exception:
-            pass
+    try:
+        cpuinfo = parse_cpuinfo()
+        if cpuinfo["is_arm"] and cpuinfo["arm_name"]:
+            return cpuinfo["arm_name"]
+    except Exception:
+        pass
+    return None
+
+def _cpu_name_windows() -> Optional[str]:
+    """CPU name from wmic (Windows)."""
+    try:
+        result = run_probe(
+            ["wmic", "cpu", "get", "name", "/value"],
+            creationflags=subprocess.CREATE_NO_WINDOW
+        )
+        for line in result.split("\n"):
+            if line.startswith("Name="):
+                return line.split("=", 1)[1].strip()
+    except Exception:
+        pass
+    return None
+
+# Platform-specific CPU name probe, chosen once for the platform we run on
+_CPU_NAME_PROBES = {
+    "Darwin": _cpu_name_darwin,
+    "Linux": _cpu_name_linux,
+    "Windows": _cpu_name_windows,
+}
+_CPU_NAME_PROBE = _CPU_NAME_PROBES.get(SYSTEM)
+
+@functools.lru_cache(maxsize=1)
+def get_cpu_name() -> str:
+    """
+    Enhanced CPU detection with support for multiple platforms.
+    Tries the platform-specific probe first, then falls back to generic methods.
+    """
+    if _CPU_NAME_PROBE is not None:
+        cpu_name = _CPU_NAME_PROBE()
+        if cpu_name:
+            return cpu_name
     
     # Fallback to platform.processor() or psutil
-    if PSUTIL_AVAILABLE:
+    psutil = _import_psutil()
+    if psutil is not None:
         try:
             # psutil provides more detailed CPU info
             cpu_info = psutil.cpu_freq()
@@ -515,83 +953,173 @@ def get_cpu_name() -> str:
         except Exception:
             pass
     
-    # Final fallback
-    processor = platform.processor()
+    # Final fallback; platform.processor() only avoids a fork (uname -p / sysctl) on Windows,
+    # and elsewhere gives nothing better than the machine type
+    processor = platform.processor() if SYSTEM == "Windows" else MACHINE
     if processor and processor != "":
         return processor
     
     return "unknown-cpu"
 
 
-def get_gpu_name() -> str:
+def get_gpu_name(cpu_name: Optional[str] = None) -> str:
     """
     Enhanced GPU detection with support for multiple platforms.
-    Tries platform-specific methods first, then falls back to generic methods.
+    Tries platform-specific methods first, then guesses integrated graphics from
+    the CPU name; pass cpu_name if it is already known to avoid detecting it again.
     """
-    system = platform.system()
+    gpu_name = _probe_gpu_name()
+    if gpu_name is not None:
+        return gpu_name
+    if cpu_name is None:
+        cpu_name = get_cpu_name()
+    return integrated_gpu_name(cpu_name)
+
+# GPU model property in `ioreg -c IOAccelerator` output, e.g. "model" = "Apple M2 Pro"
+IOREG_MODEL_RE = re.compile(r'"model" = <?"([^"]+)"')
+# GPU name line in plain-text `system_profiler SPDisplaysDataType` output
+CHIPSET_MODEL_RE = re.compile(r"Chipset Model:[^\S\n]*(.+)")
+
+def _gpu_name_darwin() -> Optional[str]:
+    """GPU model from IOKit, falling back to the much slower system_profiler (macOS)."""
+    try:
+        match = IOREG_MODEL_RE.search(run_probe(["ioreg", "-rd1", "-c", "IOAccelerator"]))
+        if match:
+            return match.group(1)
+    except Exception:
+        pass
     
-    # Try GPUtil first (works for NVIDIA GPUs on all platforms)
-    if GPUTIL_AVAILABLE:
+    try:
+        # Plain-text output is cheaper to produce and scan than the -json report
+        match = CHIPSET_MODEL_RE.search(run_probe(["system_profiler", "SPDisplaysDataType"]))
+        if match:
+            return match.group(1).strip()
+    except Exception:
+        pass
+    return None
+
+PCI_DEVICES_DIR = "/sys/bus/pci/devices"
+NVIDIA_PROC_DIR = "/proc/driver/nvidia"
+NVIDIA_PROC_GPUS_DIR = os.path.join(NVIDIA_PROC_DIR, "gpus")
+# PCI vendor IDs of GPU makers, in order of preference when a machine has several
+# display controllers (discrete before integrated and BMC adapters)
+PCI_GPU_VENDORS = {
+    "0x10de": "NVIDIA",
+    "0x1002": "AMD",
+    "0x8086": "Intel",
+    "0x1a03": "ASPEED",
+}
+
+@functools.lru_cache(maxsize=1)
+def is_nvidia_driver_loaded() -> bool:
+    """
+    Check if the NVIDIA kernel driver is loaded, so GPUtil, nvidia-smi and NVML are worth trying.
+    Only Linux exposes this cheaply; elsewhere the driver is assumed to be present.
+    """
+    return SYSTEM != "Linux" or os.path.isdir(NVIDIA_PROC_DIR)
+
+def _pci_display_devices() -> List[Tuple[str, str, str]]:
+    """(slot, vendor id, device id) of every PCI display controller, read from sysfs."""
+    devices = []
+    try:
+        with os.scandir(PCI_DEVICES_DIR) as entries:
+            slots = sorted(entry.path for entry in entries)
+    except OSError:
+        return devices
+    for slot in slots:
         try:
-            gpus = GPUtil.getGPUs()
-            if gpus:
-                return gpus[0].name
-        except Exception:
-            pass
-    
-    # macOS - use system_profiler
-    if system == "Darwin":
+            # Class 0x03xxxx is a display controller (VGA, 3D or other)
+            if not Path(slot, "class").read_text().startswith("0x03"):
+                continue
+            vendor = Path(slot, "vendor").read_text().strip()
+            device = Path(slot, "device").read_text().strip()
+        except OSError:
+            continue
+        devices.append((os.path.basename(slot), vendor, device))
+    preference = list(PCI_GPU_VENDORS)
+    devices.sort(key=lambda d: preference.index(d[1]) if d[1] in preference else len(preference))
+    return devices
+
+# PCI ID database used by lspci (pciutils/hwdata), in its usual locations
+PCI_IDS_PATHS = ("/usr/share/hwdata/pci.ids", "/usr/share/misc/pci.ids", "/usr/share/pci.ids")
+
+def _pci_ids_name(vendor: str, device: str) -> Optional[str]:
+    """
+    Look up "<vendor> <device>" names for hex PCI IDs (as read from sysfs, e.g. "0x10de")
+    in the pci.ids database, the same names lspci prints. None if it isn't installed or lacks them.
+    """
+    vendor, device = vendor[2:], device[2:]
+    for path in PCI_IDS_PATHS:
         try:
-            sp = subprocess.check_output(
-                ["system_profiler", "SPDisplaysDataType", "-json"], text=True
-            )
-            data = json.loads(sp)
-            gpus = data["SPDisplaysDataType"]
-            # Take first GPU name
-            if gpus:
-                return gpus[0].get("_name", "unknown-gpu")
-        except Exception:
-            pass
+            ids = Path(path).read_text(errors="replace")
+        except OSError:
+            continue
+        # Vendor lines start in column 0; their device lines follow, indented by one tab
+        vendor_match = re.search(rf"^{vendor}  (.+)\n((?:[\t#].*\n)*)", ids, re.M)
+        if vendor_match is None:
+            return None
+        device_match = re.search(rf"^\t{device}  (.+)$", vendor_match.group(2), re.M)
+        if device_match is None:
+            return None
+        return f"{vendor_match.group(1).strip()} {device_match.group(1).strip()}"
+    return None
+
+def _gpu_name_pci_sysfs() -> Tuple[Optional[str], Optional[str]]:
+    """
+    Find the GPU from sysfs without spawning lspci.
+    Returns (model, vendor_name): the model when the driver (NVIDIA) or the pci.ids
+    database names it, and a vendor-level name to fall back on if no probe names it.
+    """
+    devices = _pci_display_devices()
+    for slot, vendor, _device in devices:
+        if vendor == "0x10de":
+            try:
+                info = Path(NVIDIA_PROC_GPUS_DIR, slot, "information").read_text()
+            except OSError:
+                continue
+            for line in info.split("\n"):
+                if line.startswith("Model:"):
+                    return line.split(":", 1)[1].strip(), None
+    if devices:
+        _slot, vendor, device = devices[0]
+        model = _pci_ids_name(vendor, device)
+        if model:
+            return model, None
+        return None, f"{PCI_GPU_VENDORS.get(vendor, 'Unknown')} GPU [{vendor[2:]}:{device[2:]}]"
+    return None, None
+
+def _gpu_name_linux() -> Optional[str]:
+    """GPU name from sysfs, lspci, nvidia-smi or glxinfo, with ARM/Raspberry Pi fallbacks (Linux)."""
+    # PCI display controllers from sysfs: no subprocess, and works without pciutils
+    pci_model, pci_vendor_name = _gpu_name_pci_sysfs()
+    if pci_model:
+        return pci_model
+    
+    # Try lspci for PCI devices
+    try:
+        result = run_probe(["lspci"])
+        for line in result.split("\n"):
+            if "vga" in line.lower() or "display" in line.lower() or "3d" in line.lower():
+                # Extract GPU name from lspci output
+                gpu_name = line.split(":")[-1].strip()
+                if gpu_name and gpu_name != "":
+                    return gpu_name
+    except Exception:
+        pass
     
-    # Linux - try multiple methods
-    elif system == "Linux":
-        # Try lspci for PCI devices
-        try:
-            result = subprocess.check_output(["lspci"], text=True)
-            for line in result.split("\n"):
-                if "vga" in line.lower() or "display" in line.lower() or "3d" in line.lower():
-                    # Extract GPU name from lspci output
-                    gpu_name = line.split(":")[-1].strip()
-                    if gpu_name and gpu_name != "":
-                        return gpu_name
-        except Exception:
-            pass
-        
-        # Try nvidia-smi for NVIDIA GPUs
+    # Try nvidia-smi for NVIDIA GPUs
+    if is_nvidia_driver_loaded():
         try:
-            result = subprocess.check_output(["nvidia-smi", "--query-gpu=name", "--format=csv,noheader"], text=True)
+            result = run_probe(["nvidia-smi", "--query-gpu=name", "--format=csv,noheader"])
             if result.strip():
                 return result.strip()
         except Exception:
             pass
-        
-        # Try /proc/driver/nvidia/gpus/ for NVIDIA GPUs
-        try:
-            nvidia_dir = "/proc/driver/nvidia/gpus/"
-            if os.path.exists(nvidia_dir):
-                for gpu_dir in os.listdir(nvidia_dir):
-                    info_file = os.path.join(nvidia_dir, gpu_dir, "information")
-                    if os.path.exists(info_file):
-                        with open(info_file, "r") as f:
-                            for line in f:
-                                if line.startswith("Model:"):
-                                    return line.split(":")[1].strip()
-        except Exception:
-            pass
-        
-        # Try glxinfo for OpenGL info
+    
+    # Try glxinfo for OpenGL info (it needs a display to connect to)
+    if os.environ.get("DISPLAY") or os.environ.get("WAYLAND_DISPLAY"):
         try:
-            result = subprocess.check_output(["glxinfo"], text=True)
+            result = run_probe(["glxinfo"])
             for line in result.split("\n"):
                 if "OpenGL renderer string:" in line:
                     renderer = line.split(":")[1].strip()
@@ -600,101 +1128,145 @@ def get_gpu_name() -> str:
         except Exception:
             pass
     
-    # Windows - try wmic
-    elif system == "Windows":
-        try:
-            result = subprocess.check_output(
-                ["wmic", "path", "win32_VideoController", "get", "name", "/value"], 
-                text=True, 
-                creationflags=subprocess.CREATE_NO_WINDOW
-            )
-            for line in result.split("\n"):
-                if line.startswith("Name=") and "=" in line:
-                    gpu_name = line.split("=", 1)[1].strip()
-                    if gpu_name and gpu_name != "":
-                        return gpu_name
-        except Exception:
-            pass
+    # Vendor-level name from the PCI IDs when no tool could name the model
+    if pci_vendor_name:
+        return pci_vendor_name
     
     # ARM-specific GPU detection (including Raspberry Pi)
-    if system == "Linux":
+    try:
+        if parse_cpuinfo()["is_arm"]:
+            # Check for Mali GPU (common on ARM systems)
+            try:
+                result = run_probe(["lspci"])
+                for line in result.split("\n"):
+                    if "mali" in line.lower() or "gpu" in line.lower():
+                        gpu_name = line.split(":")[-1].strip()
+                        if gpu_name and gpu_name != "":
+                            return gpu_name
+            except Exception:
+                pass
+            
+            # Check for VideoCore (Raspberry Pi specific) - only if vcgencmd is available
+            if is_vcgencmd_available():
+                try:
+                    result = run_probe(["vcgencmd", "get_cpu"])
+                    if "arm" in result.lower():
+                        return "Raspberry Pi VideoCore"
+                except Exception:
+                    pass
+            
+            # Check for ARM GPU in device tree
+            try:
+                if os.path.exists("/proc/device-tree/soc/gpu"):
+                    return "ARM Mali GPU"
+            except Exception:
+                pass
+            
+            # Check for GPU in /sys/class/graphics
+            try:
+                if os.path.exists("/sys/class/graphics"):
+                    for item in os.listdir("/sys/class/graphics"):
+                        if item.startswith("fb"):
+                            # Check for Mali GPU in framebuffer
+                            try:
+                                with open(f"/sys/class/graphics/{item}/name", "r") as f:
+                                    name = f.read().strip()
+                                    if "mali" in name.lower():
+                                        return f"ARM {name}"
+                            except Exception:
+                                pass
+            except Exception:
+                pass
+            
+            # Check for GPU in /dev/dri
+            try:
+                if os.path.exists("/dev/dri"):
+                    for item in os.listdir("/dev/dri"):
+                        if item.startswith("card"):
+                            # Try to get GPU info from DRI
+                            try:
+                                result = Path(f"/sys/class/drm/{item}/device/uevent").read_text()
+                                for line in result.split("\n"):
+                                    if "DRIVER=" in line:
+                                        driver = line.split("=")[1].strip()
+                                        if "mali" in driver.lower():
+                                            return f"ARM Mali GPU ({driver})"
+                            except Exception:
+                                pass
+            except Exception:
+                pass
+    except Exception:
+        pass
+    return None
+
+def _gpu_name_windows() -> Optional[str]:
+    """GPU name from wmic (Windows)."""
+    try:
+        result = run_probe(
+            ["wmic", "path", "win32_VideoController", "get", "name", "/value"],
+            creationflags=subprocess.CREATE_NO_WINDOW
+        )
+        for line in result.split("\n"):
+            if line.startswith("Name=") and "=" in line:
+                gpu_name = line.split("=", 1)[1].strip()
+                if gpu_name and gpu_name != "":
+                    return gpu_name
+    except Exception:
+        pass
+    return None
+
+# Platform-specific GPU name probe, chosen once for the platform we run on
+_GPU_NAME_PROBES = {
+    "Darwin": _gpu_name_darwin,
+    "Linux": _gpu_name_linux,
+    "Windows": _gpu_name_windows,
+}
+_GPU_NAME_PROBE = _GPU_NAME_PROBES.get(SYSTEM)
+
+@functools.lru_cache(maxsize=1)
+def _probe_gpu_name() -> Optional[str]:
+    """
+    Run the GPU probes: NVML, GPUtil, then the platform-specific probe.
+    Returns None if none of them found a GPU.
+    """
+    global GPUTIL_AVAILABLE
+    # NVML first: a library call on the handle the temperature reader uses anyway.
+    # Skipped while the GPU is suspended, since initialising NVML would wake it
+    if is_nvidia_driver_loaded() and _nvidia_gpu_awake():
+        name = _with_nvml(lambda handle: pynvml.nvmlDeviceGetName(handle))
+        if name is not None:
+            # Older pynvml versions return bytes
+            return name.decode() if isinstance(name, bytes) else name
+    
+    # Then GPUtil (works for NVIDIA GPUs on all platforms, but runs nvidia-smi)
+    if GPUTIL_AVAILABLE and is_nvidia_driver_loaded():
         try:
-            with open("/proc/cpuinfo", "r") as f:
-                cpuinfo = f.read()
-                if "arm" in cpuinfo.lower() or "aarch64" in cpuinfo.lower():
-                    # Check for Mali GPU (common on ARM systems)
-                    try:
-                        result = subprocess.check_output(["lspci"], text=True)
-                        for line in result.split("\n"):
-                            if "mali" in line.lower() or "gpu" in line.lower():
-                                gpu_name = line.split(":")[-1].strip()
-                                if gpu_name and gpu_name != "":
-                                    return gpu_name
-                    except Exception:
-                        pass
-                    
-                    # Check for VideoCore (Raspberry Pi specific) - only if vcgencmd is available
-                    if is_vcgencmd_available():
-                        try:
-                            result = subprocess.check_output(["vcgencmd", "get_cpu"], text=True)
-                            if "arm" in result.lower():
-                                return "Raspberry Pi VideoCore"
-                        except Exception:
-                            pass
-                    
-                    # Check for ARM GPU in device tree
-                    try:
-                        if os.path.exists("/proc/device-tree/soc/gpu"):
-                            return "ARM Mali GPU"
-                    except Exception:
-                        pass
-                    
-                    # Check for GPU in /sys/class/graphics
-                    try:
-                        if os.path.exists("/sys/class/graphics"):
-                            for item in os.listdir("/sys/class/graphics"):
-                                if item.startswith("fb"):
-                                    # Check for Mali GPU in framebuffer
-                                    try:
-                                        with open(f"/sys/class/graphics/{item}/name", "r") as f:
-                                            name = f.read().strip()
-                                            if "mali" in name.lower():
-                                                return f"ARM {name}"
-                                    except Exception:
-                                        pass
-                    except Exception:
-                        pass
-                    
-                    # Check for GPU in /dev/dri
-                    try:
-                        if os.path.exists("/dev/dri"):
-                            for item in os.listdir("/dev/dri"):
-                                if item.startswith("card"):
-                                    # Try to get GPU info from DRI
-                                    try:
-                                        result = subprocess.check_output(["cat", f"/sys/class/drm/{item}/device/uevent"], text=True)
-                                        for line in result.split("\n"):
-                                            if "DRIVER=" in line:
-                                                driver = line.split("=")[1].strip()
-                                                if "mali" in driver.lower():
-                                                    return f"ARM Mali GPU ({driver})"
-                                    except Exception:
-                                        pass
-                    except Exception:
-                        pass
+            import GPUtil
+            gpus = GPUtil.getGPUs()
+            if gpus:
+                return gpus[0].name
+        except ImportError:
+            GPUTIL_AVAILABLE = False
         except Exception:
             pass
     
-    # Try to detect integrated graphics from CPU info
+    if _GPU_NAME_PROBE is not None:
+        return _GPU_NAME_PROBE()
+    return None
+
+def integrated_gpu_name(cpu_name: str) -> str:
+    """
+    Guess the integrated graphics from the CPU name when no GPU probe succeeded.
+    """
     try:
-        cpu_name = get_cpu_name().lower()
+        cpu_name = cpu_name.lower()
         if "intel" in cpu_name:
             return "Intel Integrated Graphics"
         elif "amd" in cpu_name:
             return "AMD Integrated Graphics"
         elif "arm" in cpu_name or "cortex" in cpu_name:
             # For ARM systems, try to detect specific GPU
-            if system == "Linux":
+            if SYSTEM == "Linux":
                 # Check for common ARM GPU drivers
                 try:
                     if os.path.exists("/sys/class/drm"):
@@ -717,58 +1289,194 @@ def get_gpu_name() -> str:
     return "unknown-gpu"
 
 
-def get_cpu_temperature() -> Optional[float]:
+# Common CPU temperature sensor names, in order of preference
+CPU_SENSOR_NAMES = ['coretemp', 'cpu_thermal', 'k10temp', 'zenpower']
+HWMON_DIR = "/sys/class/hwmon"
+
+# Path of the CPU hwmon temperature file, resolved on first use
+_CPU_HWMON_PATH: Optional[str] = None
+_CPU_HWMON_PROBED = False
+
+def _find_cpu_hwmon_path() -> Optional[str]:
     """
-    Get CPU temperature in Celsius.
-    Uses platform-specific methods with fallbacks.
+    Find the temp1_input file of the preferred CPU sensor under /sys/class/hwmon.
+    Returns None if no known CPU sensor is exposed.
     """
-    system = platform.system()
-    
-    # Linux - use psutil sensors
-    if system == "Linux" and PSUTIL_AVAILABLE:
-        try:
-            temps = psutil.sensors_temperatures()
-            # Try common CPU temperature sensor names
-            for sensor_name in ['coretemp', 'cpu_thermal', 'k10temp', 'zenpower']:
-                if sensor_name in temps:
-                    sensors = temps[sensor_name]
-                    if sensors:
-                        # Return the first available temperature
-                        return round(sensors[0].current, 1)
-        except Exception:
-            pass
+    found = {}
+    try:
+        for hwmon in os.listdir(HWMON_DIR):
+            try:
+                with open(os.path.join(HWMON_DIR, hwmon, "name"), "r") as f:
+                    name = f.read().strip()
+            except OSError:
+                continue
+            temp_file = os.path.join(HWMON_DIR, hwmon, "temp1_input")
+            if name in CPU_SENSOR_NAMES and name not in found and os.path.exists(temp_file):
+                found[name] = temp_file
+    except OSError:
+        return None
+    
+    for sensor_name in CPU_SENSOR_NAMES:
+        if sensor_name in found:
+            return found[sensor_name]
+    return None
+
+def _read_cpu_hwmon_temperature() -> Optional[float]:
+    """
+    Read the CPU temperature straight from sysfs (Linux only).
+    The sensor file is located once and kept open, so each read is a single pread.
+    """
+    global _CPU_HWMON_PATH, _CPU_HWMON_PROBED
+    if not _CPU_HWMON_PROBED:
+        _CPU_HWMON_PROBED = True
+        _CPU_HWMON_PATH = _find_cpu_hwmon_path()
     
-    # macOS - try system_profiler and powermetrics
-    elif system == "Darwin":
+    return _read_millicelsius(_CPU_HWMON_PATH)
+
+def _read_millicelsius(path: Optional[str]) -> Optional[float]:
+    """Read a sysfs temperature file (millidegrees Celsius) and return degrees."""
+    if path is None:
+        return None
+    try:
+        temp_millicelsius = int(read_persistent_file(path, limit=16))
+        return round(temp_millicelsius / 1000.0, 1)
+    except (OSError, ValueError):
+        return None
+
+# psutil sensor key that holds the CPU temperature, chosen on first use
+_PSUTIL_CPU_SENSOR: Optional[str] = None
+
+def _find_psutil_cpu_sensor(temps: Dict[str, list]) -> Optional[str]:
+    """Pick the CPU sensor: a known sensor name first, then any name containing 'cpu'."""
+    for sensor_name in CPU_SENSOR_NAMES:
+        if temps.get(sensor_name):
+            return sensor_name
+    for sensor_name, sensors in temps.items():
+        if sensors and 'cpu' in sensor_name.lower():
+            return sensor_name
+    return None
+
+def _read_psutil_cpu_temperature() -> Optional[float]:
+    """
+    Read the CPU temperature from psutil.sensors_temperatures().
+    The sensor key is looked up directly, and only searched for again if it disappears.
+    """
+    global _PSUTIL_CPU_SENSOR
+    psutil = _import_psutil()
+    if psutil is None:
+        return None
+    try:
+        temps = psutil.sensors_temperatures()
+    except Exception:
+        return None
+    
+    sensors = temps.get(_PSUTIL_CPU_SENSOR) if _PSUTIL_CPU_SENSOR else None
+    if not sensors:
+        _PSUTIL_CPU_SENSOR = _find_psutil_cpu_sensor(temps)
+        if _PSUTIL_CPU_SENSOR is None:
+            return None
+        sensors = temps[_PSUTIL_CPU_SENSOR]
+    # Return the first available temperature
+    return round(sensors[0].current, 1)
+
+# macOS powermetrics is kept running and sampled in the background instead of
+# being spawned (and blocking for a full sample interval) on every heartbeat
+POWERMETRICS_INTERVAL_MS = 10000
+_POWERMETRICS_PROC: Optional[subprocess.Popen] = None
+_POWERMETRICS_STARTED = False
+_POWERMETRICS_BUFFER = ""
+# Latest die temperatures by kind; Intel Macs report the GPU die alongside the CPU
+_POWERMETRICS_LAST_TEMPS: Dict[str, Optional[float]] = {"cpu": None, "gpu": None}
+_POWERMETRICS_LINES = {"CPU die temperature": "cpu", "GPU die temperature": "gpu"}
+# CPU and GPU temperatures are read from different threads
+_POWERMETRICS_LOCK = threading.Lock()
+
+def _start_powermetrics():
+    """Launch powermetrics in streaming mode with a non-blocking stdout."""
+    global _POWERMETRICS_PROC
+    try:
+        _POWERMETRICS_PROC = subprocess.Popen(
+            ["powermetrics", "--samplers", "smc", "-i", str(POWERMETRICS_INTERVAL_MS)],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL
+        )
+        os.set_blocking(_POWERMETRICS_PROC.stdout.fileno(), False)
+        atexit.register(_stop_powermetrics)
+    except Exception:
+        _POWERMETRICS_PROC = None
+
+def _stop_powermetrics():
+    """Terminate the powermetrics child process, if it is running."""
+    global _POWERMETRICS_PROC
+    if _POWERMETRICS_PROC is not None:
         try:
-            # Try powermetrics for CPU temperature (requires sudo)
-            result = subprocess.check_output(
-                ["powermetrics", "--samplers", "smc", "-n", "1", "-i", "1000"], 
-                text=True, 
-                stderr=subprocess.DEVNULL
-            )
-            for line in result.split('\n'):
-                if 'CPU die temperature' in line:
-                    # Extract temperature value
-                    temp_match = line.split(':')[-1].strip().replace('C', '')
-                    return round(float(temp_match), 1)
+            _POWERMETRICS_PROC.terminate()
         except Exception:
             pass
+        _POWERMETRICS_PROC = None
+
+def _read_powermetrics_temperature(kind: str = "cpu") -> Optional[float]:
+    """
+    Return the most recent CPU ("cpu") or GPU ("gpu") die temperature reported by powermetrics.
+    Only output that is already buffered is consumed, so this never blocks.
+    """
+    global _POWERMETRICS_STARTED, _POWERMETRICS_BUFFER
+    with _POWERMETRICS_LOCK:
+        if not _POWERMETRICS_STARTED:
+            _POWERMETRICS_STARTED = True
+            _start_powermetrics()
+        
+        if _POWERMETRICS_PROC is None:
+            return _POWERMETRICS_LAST_TEMPS[kind]
         
-        # Fallback: try system_profiler (less reliable)
+        stdout = _POWERMETRICS_PROC.stdout
         try:
-            result = subprocess.check_output(
-                ["system_profiler", "SPHardwareDataType", "-json"], 
-                text=True
-            )
-            data = json.loads(result)
-            # This is a fallback - system_profiler doesn't always have temp data
-            # but we can try to extract any thermal info if available
-        except Exception:
+            ready, _, _ = select.select([stdout], [], [], 0)
+            while ready:
+                chunk = os.read(stdout.fileno(), 65536)
+                if not chunk:
+                    # powermetrics exited (usually because we are not running as root)
+                    _stop_powermetrics()
+                    break
+                _POWERMETRICS_BUFFER += chunk.decode(errors="replace")
+                ready, _, _ = select.select([stdout], [], [], 0)
+        except (BlockingIOError, OSError, ValueError):
             pass
+        
+        # Keep the trailing partial line for the next read
+        lines = _POWERMETRICS_BUFFER.split('\n')
+        _POWERMETRICS_BUFFER = lines.pop()
+        for line in lines:
+            label, _, value = line.partition(':')
+            if label.strip() in _POWERMETRICS_LINES:
+                try:
+                    temp_match = value.strip().replace('C', '')
+                    _POWERMETRICS_LAST_TEMPS[_POWERMETRICS_LINES[label.strip()]] = round(float(temp_match), 1)
+                except ValueError:
+                    pass
+        
+        return _POWERMETRICS_LAST_TEMPS[kind]
+
+def get_cpu_temperature() -> Optional[float]:
+    """
+    Get CPU temperature in Celsius.
+    Uses platform-specific methods with fallbacks.
+    """
+    # Linux - read the hwmon sensor directly, fall back to psutil sensors below
+    if SYSTEM == "Linux":
+        temp = _read_cpu_hwmon_temperature()
+        if temp is not None:
+            return temp
+    
+    # macOS - powermetrics
+    elif SYSTEM == "Darwin":
+        # Latest sample from the long-running powermetrics reader (requires sudo)
+        temp = _read_powermetrics_temperature()
+        if temp is not None:
+            return temp
     
     # Windows - use WMI
-    elif system == "Windows" and WMI_AVAILABLE:
+    elif SYSTEM == "Windows" and WMI_AVAILABLE:
         try:
             w = wmi.WMI(namespace="root\\wmi")
             temperature_info = w.MSAcpi_ThermalZoneTemperature()[0]
@@ -779,152 +1487,476 @@ def get_cpu_temperature() -> Optional[float]:
             pass
     
     # Generic fallback using psutil if available
-    if PSUTIL_AVAILABLE:
+    return _read_psutil_cpu_temperature()
+
+
+DRM_DIR = "/sys/class/drm"
+
+# Path of the GPU hwmon temperature file, resolved on first use
+_GPU_HWMON_PATH: Optional[str] = None
+_GPU_HWMON_PROBED = False
+
+def _find_gpu_hwmon_path() -> Optional[str]:
+    """
+    Find the temp1_input file of the first DRM card that exposes a hwmon sensor
+    (amdgpu, i915/xe). Returns None if there is none.
+    """
+    try:
+        with os.scandir(DRM_DIR) as entries:
+            cards = sorted(entry.name for entry in entries if entry.name[:4] == "card")
+    except OSError:
+        return None
+    for card in cards:
+        temp_files = glob.glob(os.path.join(DRM_DIR, card, "device", "hwmon", "hwmon*", "temp1_input"))
+        if temp_files:
+            return temp_files[0]
+    return None
+
+def _read_gpu_hwmon_temperature() -> Optional[float]:
+    """
+    Read the GPU temperature straight from sysfs (Linux only).
+    The sensor file is located once and kept open, so each read is a single pread.
+    """
+    global _GPU_HWMON_PATH, _GPU_HWMON_PROBED
+    if not _GPU_HWMON_PROBED:
+        _GPU_HWMON_PROBED = True
+        _GPU_HWMON_PATH = _find_gpu_hwmon_path()
+    return _read_millicelsius(_GPU_HWMON_PATH)
+
+# PCI power_state of the NVIDIA GPU (Linux), used to avoid waking it from D3cold
+NVIDIA_PCI_DEVICES_GLOB = "/sys/bus/pci/drivers/nvidia/*:*"
+_NVIDIA_POWER_STATE_PATH: Optional[str] = None
+_NVIDIA_POWER_STATE_PROBED = False
+
+def _probe_nvidia_power_state_path():
+    """Locate the power_state file of the first NVIDIA PCI device, once."""
+    global _NVIDIA_POWER_STATE_PATH, _NVIDIA_POWER_STATE_PROBED
+    if not _NVIDIA_POWER_STATE_PROBED:
+        _NVIDIA_POWER_STATE_PROBED = True
+        for device in sorted(glob.glob(NVIDIA_PCI_DEVICES_GLOB)):
+            power_state = os.path.join(device, "power_state")
+            if os.path.exists(power_state):
+                _NVIDIA_POWER_STATE_PATH = power_state
+                break
+
+def _nvidia_gpu_awake() -> bool:
+    """
+    Return False if the NVIDIA GPU is runtime-suspended (D3cold), e.g. an idle
+    Optimus laptop dGPU. Returns True when the power state can't be determined.
+    """
+    _probe_nvidia_power_state_path()
+    if _NVIDIA_POWER_STATE_PATH is None:
+        return True
+    try:
+        return read_persistent_file(_NVIDIA_POWER_STATE_PATH, limit=16).strip() != "D3cold"
+    except OSError:
+        return True
+
+def _nvidia_runtime_pm_enabled() -> bool:
+    """
+    Return True if the kernel may runtime-suspend the NVIDIA GPU (power/control is "auto").
+    The GPU only suspends while nothing holds it open, so NVML and nvidia-smi are then
+    used one read at a time instead of being kept running.
+    """
+    _probe_nvidia_power_state_path()
+    if _NVIDIA_POWER_STATE_PATH is None:
+        return False
+    control = os.path.join(os.path.dirname(_NVIDIA_POWER_STATE_PATH), "power", "control")
+    try:
+        return read_persistent_file(control, limit=16).strip() == "auto"
+    except OSError:
+        return False
+
+# NVML is initialised once and kept open; driver init is by far its most expensive call.
+# With runtime PM enabled it is released after each use so the GPU can suspend
+_NVML_HANDLE = None
+_NVML_FAILED = False  # Set when init fails or finds no GPU, so NVML is not retried
+_NVML_LOCK = threading.RLock()
+
+def _ensure_nvml():
+    """
+    Initialise NVML on first use and return the handle of GPU 0.
+    Returns None if pynvml is unavailable or NVML can't be used on this machine.
+    """
+    global _NVML_HANDLE, _NVML_FAILED
+    if _NVML_HANDLE is not None or _NVML_FAILED or not PYNVML_AVAILABLE:
+        return _NVML_HANDLE
+    with _NVML_LOCK:
+        if _NVML_HANDLE is None and not _NVML_FAILED:
+            try:
+                pynvml.nvmlInit()
+            except Exception:
+                _NVML_FAILED = True
+                return None
+            try:
+                if pynvml.nvmlDeviceGetCount() > 0:
+                    _NVML_HANDLE = pynvml.nvmlDeviceGetHandleByIndex(0)
+            except Exception:
+                pass
+            if _NVML_HANDLE is None:
+                _NVML_FAILED = True
+                pynvml.nvmlShutdown()
+    return _NVML_HANDLE
+
+def _shutdown_nvml():
+    """Release NVML at exit."""
+    global _NVML_HANDLE
+    if _NVML_HANDLE is not None:
+        _NVML_HANDLE = None
         try:
-            temps = psutil.sensors_temperatures()
-            # Look for any temperature sensor
-            for sensor_name, sensors in temps.items():
-                if sensors and 'cpu' in sensor_name.lower():
-                    return round(sensors[0].current, 1)
+            pynvml.nvmlShutdown()
         except Exception:
             pass
-    
-    return None
 
+atexit.register(_shutdown_nvml)
 
-def get_gpu_temperature() -> Optional[float]:
+def _with_nvml(read: Callable[[any], any]):
     """
-    Get GPU temperature in Celsius.
-    Supports NVIDIA, AMD, and integrated graphics with fallbacks.
+    Call read(handle) for GPU 0 and return its result, or None if NVML can't be
+    used or the call fails. NVML is released afterwards when runtime PM is enabled.
     """
-    system = platform.system()
-    
-    # Try NVIDIA GPUs first (works on all platforms)
-    if PYNVML_AVAILABLE:
+    with _NVML_LOCK:
+        handle = _ensure_nvml()
+        if handle is None:
+            return None
         try:
-            pynvml.nvmlInit()
-            device_count = pynvml.nvmlDeviceGetCount()
-            if device_count > 0:
-                handle = pynvml.nvmlDeviceGetHandleByIndex(0)
-                temp = pynvml.nvmlDeviceGetTemperature(handle, pynvml.NVML_TEMPERATURE_GPU)
-                pynvml.nvmlShutdown()
-                return round(float(temp), 1)
+            return read(handle)
         except Exception:
-            pass
-    
-    # Try nvidia-smi command (works on Linux and Windows)
+            return None
+        finally:
+            if _nvidia_runtime_pm_enabled():
+                _shutdown_nvml()
+
+# nvidia-smi is kept running in loop mode rather than forked (and the driver
+# re-initialised) for every poll; a reader thread keeps the latest sample
+NVIDIA_SMI_INTERVAL_MS = 2000
+_NVIDIA_SMI_PROC: Optional[subprocess.Popen] = None
+_NVIDIA_SMI_STARTED = False
+_NVIDIA_SMI_LAST_TEMP: Optional[float] = None
+_NVIDIA_SMI_FIRST_SAMPLE = threading.Event()
+
+def _start_nvidia_smi():
+    """Launch nvidia-smi in loop mode and a daemon thread that reads its samples."""
+    global _NVIDIA_SMI_PROC
+    tool = PROBE_TOOLS["nvidia-smi"]
+    if tool is None:
+        return
     try:
-        result = subprocess.check_output(
-            ["nvidia-smi", "--query-gpu=temperature.gpu", "--format=csv,noheader,nounits"], 
-            text=True, 
-            stderr=subprocess.DEVNULL
+        _NVIDIA_SMI_PROC = subprocess.Popen(
+            [tool, "--query-gpu=temperature.gpu", "--format=csv,noheader,nounits",
+             "-i", "0", "-lms", str(NVIDIA_SMI_INTERVAL_MS)],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            text=True,
+            bufsize=1,
+            creationflags=getattr(subprocess, "CREATE_NO_WINDOW", 0)
         )
-        if result.strip():
-            return round(float(result.strip()), 1)
     except Exception:
+        _NVIDIA_SMI_PROC = None
+        return
+    atexit.register(_stop_nvidia_smi)
+    threading.Thread(target=_nvidia_smi_reader, args=(_NVIDIA_SMI_PROC,), daemon=True).start()
+    # Wait for the first sample so the first poll behaves like a one-shot query
+    _NVIDIA_SMI_FIRST_SAMPLE.wait(PROBE_TIMEOUT)
+
+def _nvidia_smi_reader(proc: subprocess.Popen):
+    """Store each temperature nvidia-smi prints until it exits."""
+    global _NVIDIA_SMI_LAST_TEMP
+    try:
+        for line in proc.stdout:
+            try:
+                _NVIDIA_SMI_LAST_TEMP = round(float(line.strip()), 1)
+            except ValueError:
+                pass
+            _NVIDIA_SMI_FIRST_SAMPLE.set()
+    except (OSError, ValueError):
         pass
-    
-    # Linux - try various GPU temperature sources
-    if system == "Linux":
-        # Try AMD GPU temperature via sysfs
-        try:
-            for card in os.listdir("/sys/class/drm"):
-                if card.startswith("card"):
-                    temp_file = f"/sys/class/drm/{card}/device/hwmon/hwmon*/temp1_input"
-                    import glob
-                    temp_files = glob.glob(temp_file)
-                    if temp_files:
-                        with open(temp_files[0], 'r') as f:
-                            temp_millicelsius = int(f.read().strip())
-                            return round(temp_millicelsius / 1000.0, 1)
-        except Exception:
-            pass
-        
-        # Try Intel GPU temperature
-        try:
-            for card in os.listdir("/sys/class/drm"):
-                if card.startswith("card"):
-                    temp_file = f"/sys/class/drm/{card}/device/hwmon/hwmon*/temp1_input"
-                    import glob
-                    temp_files = glob.glob(temp_file)
-                    if temp_files:
-                        with open(temp_files[0], 'r') as f:
-                            temp_millicelsius = int(f.read().strip())
-                            return round(temp_millicelsius / 1000.0, 1)
-        except Exception:
-            pass
-    
-    # macOS - try system_profiler for GPU temperature
-    elif system == "Darwin":
-        try:
-            result = subprocess.check_output(
-                ["system_profiler", "SPDisplaysDataType", "-json"], 
-                text=True
-            )
-            data = json.loads(result)
-            displays = data.get("SPDisplaysDataType", [])
-            for display in displays:
-                # Look for temperature info in display data
-                if "temperature" in str(display).lower():
-                    # This is a fallback - actual temperature extraction would need
-                    # more specific parsing based on the actual data structure
-                    pass
-        except Exception:
-            pass
-    
-    # Windows - try WMI for GPU temperature
-    elif system == "Windows" and WMI_AVAILABLE:
+    # nvidia-smi exited (no driver or no GPU); stop reporting stale samples
+    _NVIDIA_SMI_LAST_TEMP = None
+    _NVIDIA_SMI_FIRST_SAMPLE.set()
+    _stop_nvidia_smi()
+
+def _stop_nvidia_smi():
+    """Terminate the nvidia-smi child process, if it is running."""
+    global _NVIDIA_SMI_PROC
+    if _NVIDIA_SMI_PROC is not None:
         try:
-            w = wmi.WMI(namespace="root\\wmi")
-            # Try to get GPU temperature from WMI
-            # This is a fallback method and may not work on all systems
-            pass
+            _NVIDIA_SMI_PROC.terminate()
         except Exception:
             pass
-    
+        _NVIDIA_SMI_PROC = None
+
+def _query_nvidia_smi_temperature() -> Optional[float]:
+    """Run nvidia-smi once for the GPU temperature; used while runtime PM is enabled."""
+    tool = PROBE_TOOLS["nvidia-smi"]
+    if tool is None:
+        return None
+    try:
+        output = subprocess.check_output(
+            [tool, "--query-gpu=temperature.gpu", "--format=csv,noheader,nounits", "-i", "0"],
+            text=True,
+            stderr=subprocess.DEVNULL,
+            timeout=PROBE_TIMEOUT,
+            creationflags=getattr(subprocess, "CREATE_NO_WINDOW", 0)
+        )
+        return round(float(output.strip()), 1)
+    except Exception:
+        return None
+
+def _read_nvidia_smi_temperature() -> Optional[float]:
+    """Return the latest GPU temperature sampled by nvidia-smi, starting it on first use."""
+    global _NVIDIA_SMI_STARTED
+    if not _NVIDIA_SMI_STARTED:
+        _NVIDIA_SMI_STARTED = True
+        _start_nvidia_smi()
+    return _NVIDIA_SMI_LAST_TEMP
+
+def _read_nvidia_temperature() -> Optional[float]:
+    """
+    Read the NVIDIA GPU temperature via NVML, falling back to nvidia-smi.
+    Returns None without touching the GPU while it is runtime-suspended.
+    """
+    if not is_nvidia_driver_loaded() or not _nvidia_gpu_awake():
+        return None
+    
+    temp = _with_nvml(lambda handle: pynvml.nvmlDeviceGetTemperature(handle, pynvml.NVML_TEMPERATURE_GPU))
+    if temp is not None:
+        return round(float(temp), 1)
+    
+    if _nvidia_runtime_pm_enabled():
+        # A looping nvidia-smi would keep the GPU awake; query it once per poll instead
+        _stop_nvidia_smi()
+        return _query_nvidia_smi_temperature()
+    # nvidia-smi in loop mode (works on Linux and Windows)
+    return _read_nvidia_smi_temperature()
+
+def _read_powermetrics_gpu_temperature() -> Optional[float]:
+    """GPU die temperature from the shared powermetrics stream (Intel Macs)."""
+    return _read_powermetrics_temperature("gpu")
+
+def _no_temperature() -> Optional[float]:
+    """GPU temperature reader used when no source works on this machine."""
     return None
 
+# GPU temperature source picked on first use, so later polls skip the fallback chain
+_GPU_TEMP_READER: Optional[Callable[[], Optional[float]]] = None
+
+def _resolve_gpu_temperature_reader() -> Tuple[Optional[Callable[[], Optional[float]]], Optional[float]]:
+    """
+    Try each GPU temperature source in order of preference.
+    Returns (reader, temperature) for the first that gives a reading, (_no_temperature, None)
+    if none does, or (None, None) if the decision has to wait until a suspended NVIDIA GPU wakes.
+    """
+    # NVIDIA first (works on all platforms)
+    readers = [_read_nvidia_temperature]
+    if SYSTEM == "Linux":
+        # AMD/Intel GPU temperature via the DRM card's hwmon sensor
+        readers.append(_read_gpu_hwmon_temperature)
+    
+    for reader in readers:
+        temp = reader()
+        if temp is not None:
+            return reader, temp
+    
+    if SYSTEM == "Darwin":
+        # powermetrics' first sample only arrives after a full interval, so use it whenever it runs
+        temp = _read_powermetrics_gpu_temperature()
+        if _POWERMETRICS_PROC is not None:
+            return _read_powermetrics_gpu_temperature, temp
+    
+    if not _nvidia_gpu_awake():
+        return None, None
+    return _no_temperature, None
+
+def get_gpu_temperature() -> Optional[float]:
+    """
+    Get GPU temperature in Celsius.
+    Supports NVIDIA, AMD, and integrated graphics; the working source is found
+    on the first call and read directly afterwards.
+    """
+    global _GPU_TEMP_READER
+    if _GPU_TEMP_READER is not None:
+        return _GPU_TEMP_READER()
+    
+    reader, temp = _resolve_gpu_temperature_reader()
+    _GPU_TEMP_READER = reader
+    return temp
 
 def get_hardware_summary() -> str:
     """
     Get a brief hardware summary for debugging purposes.
     """
     try:
-        cpu = get_cpu_name()
-        gpu = get_gpu_name()
-        cpu_temp = get_cpu_temperature()
-        gpu_temp = get_gpu_temperature()
+        identity = get_static_identity()
+        cpu = identity["cpu"]
+        gpu = identity["gpu"]
+        cpu_temp, gpu_temp = get_cached_temperatures()
         
-        summary = f"CPU: {cpu}"
-        if cpu_temp is not None:
-            summary += f" ({cpu_temp}°C)"
-        
-        summary += f", GPU: {gpu}"
-        if gpu_temp is not None:
-            summary += f" ({gpu_temp}°C)"
-        
-        return summary
+        parts = [f"CPU: {cpu}" if cpu_temp is None else f"CPU: {cpu} ({cpu_temp}°C)",
+                 f"GPU: {gpu}" if gpu_temp is None else f"GPU: {gpu} ({gpu_temp}°C)"]
+        return ", ".join(parts)
     except Exception:
         return "Hardware detection failed"
 
+# Temperatures change slowly, so sensors are read at most this often (seconds)
+TEMP_POLL_INTERVAL = float(SENTRY_CONFIG["TEMP_POLL_INTERVAL"])
+_TEMP_CACHE = {"cpu": None, "gpu": None, "time": float('-inf')}
+# Sensor read in flight per source. Reads run on daemon threads so a hung sensor
+# can't hold up interpreter exit, and a source isn't read again until it returns
+_TEMP_THREADS: Dict[str, threading.Thread] = {}
+
+def _read_temperature_into_cache(key: str, read: Callable[[], Optional[float]]):
+    """Sensor thread body: read one temperature source and store the result in _TEMP_CACHE."""
+    if SYSTEM == "Windows" and WMI_AVAILABLE:
+        # WMI raises x_wmi_uninitialised_thread on threads where COM isn't initialised
+        import pythoncom
+        pythoncom.CoInitialize()
+    try:
+        _TEMP_CACHE[key] = read()
+    except Exception:
+        pass  # Keep the previous reading
+
+def get_cached_temperatures() -> Tuple[Optional[float], Optional[float]]:
+    """
+    Return (cpu_temperature, gpu_temperature), re-reading the sensors only
+    when the last reading is older than TEMP_POLL_INTERVAL.
+    """
+    now = time.monotonic()
+    if now - _TEMP_CACHE["time"] >= TEMP_POLL_INTERVAL:
+        # The CPU and GPU sources are independent, so read them side by side
+        threads = []
+        for key, read in (("cpu", get_cpu_temperature), ("gpu", get_gpu_temperature)):
+            thread = _TEMP_THREADS.get(key)
+            if thread is None or not thread.is_alive():
+                thread = threading.Thread(target=_read_temperature_into_cache, args=(key, read),
+                                          name=f"temp-{key}", daemon=True)
+                _TEMP_THREADS[key] = thread
+                thread.start()
+            threads.append(thread)
+        # A sensor that hangs keeps its previous reading; its late result still lands in the cache
+        deadline = time.monotonic() + PROBE_TIMEOUT
+        for thread in threads:
+            thread.join(max(0.0, deadline - time.monotonic()))
+        _TEMP_CACHE["time"] = now
+    return _TEMP_CACHE["cpu"], _TEMP_CACHE["gpu"]
+
+def warm_up_temperature_sensors():
+    """
+    Take a first reading of each temperature source so sensor lookup
+    (hwmon paths, powermetrics, failing probes) happens during startup.
+    """
+    get_cached_temperatures()
+
+# CPU/GPU names are cached on disk so restarts skip the slow probe chains
+HARDWARE_CACHE_FILE = os.path.join(os.path.expanduser("~"), ".cache", "mata_sentry", "hw.json")
+HARDWARE_CACHE_MAX_AGE = 7 * 24 * 3600  # Re-probe hardware at least weekly
+
+def _hardware_cache_key() -> str:
+    """Identify the machine/kernel a cached hardware entry belongs to."""
+    return f"{platform.node()} {RELEASE}"
+
+def load_hardware_cache() -> Optional[Dict[str, str]]:
+    """
+    Return cached CPU/GPU names for this machine, or None if the cache is
+    missing, stale, or was written on a different host/kernel.
+    """
+    try:
+        with open(HARDWARE_CACHE_FILE, 'r') as f:
+            cache = json.load(f)
+        if cache.get("key") != _hardware_cache_key():
+            return None
+        if time.time() - cache.get("saved_at", 0) > HARDWARE_CACHE_MAX_AGE:
+            return None
+        return {"cpu": cache["cpu"], "gpu": cache["gpu"]}
+    except Exception:
+        return None
+
+def save_hardware_cache(hardware: Dict[str, str]):
+    """Persist detected CPU/GPU names; failures are ignored."""
+    try:
+        os.makedirs(os.path.dirname(HARDWARE_CACHE_FILE), exist_ok=True)
+        with open(HARDWARE_CACHE_FILE, 'w') as f:
+            json.dump({"key": _hardware_cache_key(), "saved_at": time.time(), **hardware}, f)
+    except Exception:
+        pass
+
+def detect_static_identity() -> Dict[str, str]:
+    """
+    Gather hostname, OS string and CPU/GPU names.
+    CPU/GPU names come from the on-disk cache when it is fresh.
+    """
+    hardware = load_hardware_cache()
+    
+    # The probes mostly wait on child processes and sysfs, so run them side by side
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        os_future = executor.submit(get_os_string)
+        if hardware is None:
+            cpu_future = executor.submit(get_cpu_name)
+            gpu_future = executor.submit(_probe_gpu_name)
+            cpu_name = cpu_future.result()
+            # Reuse the CPU name for the integrated graphics guess instead of detecting it twice
+            gpu_name = gpu_future.result() or integrated_gpu_name(cpu_name)
+            hardware = {"cpu": cpu_name, "gpu": gpu_name}
+            # Don't pin a failed detection for a week
+            if hardware["cpu"] != "unknown-cpu" and hardware["gpu"] != "unknown-gpu":
+                save_hardware_cache(hardware)
+        os_string = os_future.result()
+    
+    return {
+        "hostname": get_hostname(),
+        "os": os_string,
+        **hardware,
+    }
+
+# OS and hardware names never change while the agent is running, so detect them
+# once at startup instead of re-probing on every heartbeat (the hostname is
+# re-checked hourly by the transport). Detection runs in the background while
+# the operator answers the prompts
+_STATIC_IDENTITY: Dict[str, str] = {}
+_STATIC_IDENTITY_THREAD: Optional[threading.Thread] = None
+
+def _detect_static_identity_in_background():
+    """Background thread body: fill _STATIC_IDENTITY."""
+    _STATIC_IDENTITY.update(detect_static_identity())
+
+def start_static_identity_detection():
+    """
+    Start detecting the node identity and warming up the temperature sensors on
+    daemon threads, unless already started.
+    """
+    global _STATIC_IDENTITY_THREAD
+    if _STATIC_IDENTITY_THREAD is not None:
+        return
+    _STATIC_IDENTITY_THREAD = threading.Thread(target=_detect_static_identity_in_background,
+                                               name="identity", daemon=True)
+    _STATIC_IDENTITY_THREAD.start()
+    threading.Thread(target=warm_up_temperature_sensors, name="temp-warm-up", daemon=True).start()
+
+def get_static_identity() -> Dict[str, str]:
+    """Return hostname, OS string and CPU/GPU names, waiting for detection to finish."""
+    start_static_identity_detection()
+    while _STATIC_IDENTITY_THREAD.is_alive():
+        # Joined in WAIT_SLICE steps so Ctrl-C still gets through on Windows
+        _STATIC_IDENTITY_THREAD.join(WAIT_SLICE)
+    return _STATIC_IDENTITY
+
 def build_payload(render_progress: Optional[Dict] = None, status: str = "idling") -> Dict[str, any]:
+    """
+    Build the per-heartbeat part of the payload.
+    Identity and secret never change, so post_payload sends them from a pre-encoded prefix.
+    """
     payload = {
-        "hostname": get_hostname(),
-        "os": get_os_string(),
-        "cpu": get_cpu_name(),
-        "gpu": get_gpu_name(),
         "timestamp": iso_timestamp(),
-        "sentry_secret": SENTRY_CONFIG["SENTRY_SECRET"],
         "status": status,
     }
     
+    cpu_temp, gpu_temp = get_cached_temperatures()
+    
     # Add CPU temperature if available
-    cpu_temp = get_cpu_temperature()
     if cpu_temp is not None:
         payload["cpu_temperature"] = f"{cpu_temp}°C"
     
     # Add GPU temperature if available
-    gpu_temp = get_gpu_temperature()
     if gpu_temp is not None:
         payload["gpu_temperature"] = f"{gpu_temp}°C"
     
@@ -940,31 +1972,243 @@ def build_payload(render_progress: Optional[Dict] = None, status: str = "idling"
 # ────────────────────────────────────────────────────────────
 SERVER_HOST = SENTRY_CONFIG["SERVER_HOST"]
 SERVER_PORT = int(SENTRY_CONFIG["SERVER_PORT"])
+SENTRY_SECRET = SENTRY_CONFIG["SENTRY_SECRET"]
 SERVER_PATH = "/submit"  # agreed endpoint
-HEADERS = {"Content-Type": "application/json"}
+HEADERS = {"Content-Type": "application/json", "Connection": "keep-alive"}
 
-def post_payload(payload: Dict[str, str]) -> tuple[str, str]:
+if ORJSON_AVAILABLE:
+    encode_json = orjson.dumps
+else:
+    def encode_json(data) -> bytes:
+        """Serialize data to UTF-8 JSON bytes (stdlib fallback for orjson.dumps)."""
+        return json.dumps(data).encode()
+
+HOSTNAME_REFRESH_INTERVAL = 3600  # Seconds between checks for a renamed host
+
+def _encode_payload_prefix() -> bytes:
+    """Encode the static payload fields, without the closing brace."""
+    return encode_json({
+        **get_static_identity(),
+        "sentry_secret": SENTRY_SECRET,
+    })[:-1]
+
+# Static payload fields encoded once, on the first heartbeat; each heartbeat only
+# encodes its dynamic fields and splices them on
+_PAYLOAD_PREFIX: Optional[bytes] = None
+_HOSTNAME_CHECKED_AT = time.monotonic()
+
+def _refresh_hostname():
+    """Pick up a host rename, checking the hostname at most once per HOSTNAME_REFRESH_INTERVAL."""
+    global _PAYLOAD_PREFIX, _HOSTNAME_CHECKED_AT
+    now = time.monotonic()
+    if now - _HOSTNAME_CHECKED_AT < HOSTNAME_REFRESH_INTERVAL:
+        return
+    _HOSTNAME_CHECKED_AT = now
+    hostname = socket.gethostname()
+    identity = get_static_identity()
+    if hostname != identity["hostname"]:
+        identity["hostname"] = hostname
+        _PAYLOAD_PREFIX = _encode_payload_prefix()
+
+def encode_payload(payload: Dict[str, any]) -> bytes:
+    """Encode a build_payload() dict into the full JSON body using the static prefix."""
+    global _PAYLOAD_PREFIX
+    if _PAYLOAD_PREFIX is None:
+        _PAYLOAD_PREFIX = _encode_payload_prefix()
+    _refresh_hostname()
+    return _PAYLOAD_PREFIX + b"," + encode_json(payload)[1:]
+
+# Idle seconds before the kernel probes the socket; below POST_INTERVAL so a dead
+# server or an expired NAT entry is noticed before the next heartbeat is sent
+TCP_KEEPALIVE_IDLE = 20
+# Linux calls the idle option TCP_KEEPIDLE, macOS calls it TCP_KEEPALIVE
+_TCP_KEEPIDLE_OPT = getattr(socket, "TCP_KEEPIDLE", getattr(socket, "TCP_KEEPALIVE", None))
+
+class _KeepAliveHTTPConnection(http_client.HTTPConnection):
+    """HTTPConnection whose socket has TCP keepalive enabled (TCP_NODELAY is set by the base class)."""
+    
+    def connect(self):
+        super().connect()
+        try:
+            self.sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+            if _TCP_KEEPIDLE_OPT is not None:
+                self.sock.setsockopt(socket.IPPROTO_TCP, _TCP_KEEPIDLE_OPT, TCP_KEEPALIVE_IDLE)
+        except OSError:
+            pass
+
+# Persistent keep-alive connection, opened lazily and reused across heartbeats
+_CONN: Optional[http_client.HTTPConnection] = None
+
+def _get_connection() -> http_client.HTTPConnection:
+    """Return the shared server connection, creating it on first use."""
+    global _CONN
+    if _CONN is None:
+        _CONN = _KeepAliveHTTPConnection(SERVER_HOST, SERVER_PORT, timeout=10)
+    return _CONN
+
+def _close_connection():
+    """Close and forget the shared connection so the next post reconnects."""
+    global _CONN
+    if _CONN is not None:
+        _CONN.close()
+        _CONN = None
+
+atexit.register(_close_connection)
+
+POST_FAILED = "✗ POST failed"  # Status prefix for a heartbeat that never reached the server
+
+def send_body(body: bytes) -> str:
     """
-    Post payload to server and return status information.
-    Returns (status_message, timestamp) tuple.
+    POST an encoded payload on the shared connection and return a status message.
     """
-    body = json.dumps(payload)
-    conn = http_client.HTTPConnection(SERVER_HOST, SERVER_PORT, timeout=10)
-    try:
-        conn.request("POST", SERVER_PATH, body=body, headers=HEADERS)
-        response = conn.getresponse()
-        status = f"{response.status} {response.reason}"
-        conn.close()
-        return status, payload['timestamp']
-    except Exception as exc:
-        return f"✗ POST failed: {exc}", payload['timestamp']
+    while True:
+        conn = _get_connection()
+        reused = conn.sock is not None
+        try:
+            conn.request("POST", SERVER_PATH, body=body, headers=HEADERS)
+            response = conn.getresponse()
+            # Drain the body so the connection can be reused for the next post
+            response.read()
+            status = f"{response.status} {response.reason}"
+            if response.will_close:
+                _close_connection()
+            return status
+        except (http_client.RemoteDisconnected, ConnectionResetError, BrokenPipeError) as exc:
+            _close_connection()
+            # The server may have dropped an idle keep-alive socket; retry once on a fresh one
+            if reused:
+                continue
+            return f"{POST_FAILED}: {exc}"
+        except Exception as exc:
+            _close_connection()
+            return f"{POST_FAILED}: {exc}"
+
+# Heartbeats are sent from a background thread so a slow server never stalls the monitor loop
+POST_QUEUE_SIZE = 8  # Pending heartbeats kept while the server is slow; the oldest is dropped first
+POST_RESULT_WAIT = 0.5  # Seconds post_payload waits for the result before reporting it as pending
+POST_RETRIES = 2  # Extra attempts for a heartbeat that failed to reach the server
+POST_RETRY_BACKOFF = 0.5  # Seconds before the first retry, doubled for each further one
+_POST_QUEUE: "queue.Queue[Dict[str, any]]" = queue.Queue(maxsize=POST_QUEUE_SIZE)
+_POSTER_THREAD: Optional[threading.Thread] = None
+POST_PENDING = "⏳ POST pending"  # Status shown until the server answers a heartbeat
+# The most recently queued heartbeat, so a pending status on screen is replaced by that
+# heartbeat's own answer (timestamps only have 1 s resolution and can be shared)
+_LAST_POST_ITEM: Optional[Dict[str, any]] = None
+# Orders "reported as pending" against "answered", so exactly the heartbeats shown as pending wake the loop
+_POST_RESULT_LOCK = threading.Lock()
+
+def _poster():
+    """Send queued heartbeats one at a time, in order."""
+    while True:
+        item = _POST_QUEUE.get()
+        item["status"] = send_body(item["body"])
+        retry_delay = POST_RETRY_BACKOFF
+        for _ in range(POST_RETRIES):
+            # Stop retrying once a newer heartbeat is queued; it supersedes this one
+            if not item["status"].startswith(POST_FAILED) or not _POST_QUEUE.empty():
+                break
+            time.sleep(retry_delay)
+            retry_delay *= 2
+            item["status"] = send_body(item["body"])
+        with _POST_RESULT_LOCK:
+            item["done"].set()
+            reported_pending = item["pending"]
+        # Let the monitor loop replace a pending status on screen with the answer
+        if reported_pending:
+            _MONITOR_WAKE.set()
 
+def post_payload(payload: Dict[str, str]) -> tuple[str, str]:
+    """
+    Queue payload for the background sender and return status information.
+    Returns (status_message, timestamp) tuple; the status is the server's answer
+    if it arrives within POST_RESULT_WAIT, otherwise a pending marker.
+    """
+    global _POSTER_THREAD, _LAST_POST_ITEM
+    if _POSTER_THREAD is None:
+        _POSTER_THREAD = threading.Thread(target=_poster, name="poster", daemon=True)
+        _POSTER_THREAD.start()
+    
+    item = {"body": encode_payload(payload), "timestamp": payload['timestamp'],
+            "done": threading.Event(), "status": None, "pending": False}
+    _LAST_POST_ITEM = item
+    while True:
+        try:
+            _POST_QUEUE.put_nowait(item)
+            break
+        except queue.Full:
+            # Drop the oldest pending heartbeat; the newer one supersedes it
+            try:
+                _POST_QUEUE.get_nowait()
+            except queue.Empty:
+                pass
+    
+    if item["done"].wait(POST_RESULT_WAIT):
+        return item["status"], payload['timestamp']
+    with _POST_RESULT_LOCK:
+        # The answer may have arrived between the timeout and taking the lock
+        if item["done"].is_set():
+            return item["status"], payload['timestamp']
+        item["pending"] = True
+    return POST_PENDING, payload['timestamp']
 
 # ────────────────────────────────────────────────────────────
 # 3.  Main loop with dynamic render monitoring
 # ────────────────────────────────────────────────────────────
 POST_INTERVAL = 30  # Maximum seconds between posts
 CHECK_INTERVAL = 2  # Seconds between directory checks
+WATCH_SETTLE_INTERVAL = 0.5  # Seconds to let a burst of watcher events (one file write) settle
+WATCH_HEALTH_INTERVAL = 10  # Seconds between checks that the watcher is still running while waiting on it
+# Ctrl-C doesn't interrupt Event.wait on Windows (bpo-29971), so waits there are cut into slices this long
+WAIT_SLICE = 0.5 if os.name == 'nt' else None
+
+def _wait_for_wake(timeout: float) -> bool:
+    """
+    _MONITOR_WAKE.wait(timeout), done in WAIT_SLICE steps on Windows so KeyboardInterrupt
+    is delivered promptly. Returns True if the event was set.
+    """
+    if WAIT_SLICE is None:
+        return _MONITOR_WAKE.wait(timeout)
+    deadline = time.monotonic() + timeout
+    while True:
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return _MONITOR_WAKE.is_set()
+        if _MONITOR_WAKE.wait(min(remaining, WAIT_SLICE)):
+            return True
+
+def wait_for_next_tick(next_tick: float, interval: float, deadline: float = float('inf')) -> float:
+    """
+    Sleep until the next tick of a fixed-rate monotonic schedule and return it.
+    Time spent working is absorbed into the interval so the cadence doesn't drift;
+    if we have fallen behind, the schedule restarts from now instead of bursting.
+    If deadline comes before the next tick, wake up at the deadline instead.
+    Returns early, keeping the schedule, if _MONITOR_WAKE is set.
+    """
+    wake = min(next_tick + interval, deadline)
+    delay = wake - time.monotonic()
+    if delay > 0:
+        if _wait_for_wake(delay):
+            _MONITOR_WAKE.clear()
+            return next_tick
+        return wake
+    return time.monotonic()
+
+def wait_for_render_change(deadline: float):
+    """
+    Block until the watched render directory reports a change, the poster finishes
+    a heartbeat, or the monotonic deadline passes, instead of waking up every CHECK_INTERVAL.
+    The deadline is the next regular update, which re-checks the directory in case the
+    watcher missed changes. Returns early if the watcher dies, so polling takes over.
+    """
+    while _render_dir_watcher_alive():
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return
+        if _wait_for_wake(min(remaining, WATCH_HEALTH_INTERVAL)):
+            _MONITOR_WAKE.clear()
+            if _RENDER_DIR_CHANGED.is_set():
+                time.sleep(WATCH_SETTLE_INTERVAL)
+            return
 
 def monitor_render_directory(render_dir: str, start_frame: int, end_frame: int):
     """
@@ -974,21 +2218,29 @@ def monitor_render_directory(render_dir: str, start_frame: int, end_frame: int):
     hardware_summary = get_hardware_summary()
     last_status = None
     last_timestamp = None
-    last_post_time = 0
+    # Times are taken from the monotonic clock so wall-clock jumps don't skew the schedule
+    last_post_time = float('-inf')  # Never posted yet
     last_frame_count = 0
+    # Set once the completion heartbeat went out, so it is sent once per render rather than every pass
+    render_complete = False
     
     # Initial display
     render_progress = get_render_progress(render_dir, start_frame, end_frame)
-    initial_status = determine_node_status(render_progress, 0, time.time(), 0)
+    initial_status = determine_node_status(render_progress, 0, time.monotonic(), last_post_time)
     clear_and_redraw_status(SERVER_HOST, SERVER_PORT, hardware_summary, last_status, last_timestamp, 
                            render_progress, render_dir, start_frame, end_frame, initial_status)
     
-    print("🎬 Starting render monitoring...")
+    if start_render_dir_watcher(render_dir):
+        show_notice("👀 Watching render directory for changes")
+    show_notice("🎬 Starting render monitoring...")
     
+    next_check = time.monotonic()
     while True:
         try:
-            current_time = time.time()
-            current_progress = get_render_progress(render_dir, start_frame, end_frame)
+            current_time = time.monotonic()
+            time_for_regular_update = (current_time - last_post_time) >= POST_INTERVAL
+            # On the regular update, also re-check a watched directory in case the watcher missed changes
+            current_progress = get_render_progress(render_dir, start_frame, end_frame, verify=time_for_regular_update)
             current_frame_count = current_progress['rendered_frames']
             
             # Determine current node status
@@ -996,7 +2248,6 @@ def monitor_render_directory(render_dir: str, start_frame: int, end_frame: int):
             
             # Check if new frames have been added or if it's time for a regular update
             new_frames_detected = current_frame_count > last_frame_count
-            time_for_regular_update = (current_time - last_post_time) >= POST_INTERVAL
             
             if new_frames_detected or time_for_regular_update:
                 # Build and send payload with current status
@@ -1011,32 +2262,50 @@ def monitor_render_directory(render_dir: str, start_frame: int, end_frame: int):
                 
                 # Show what triggered the update
                 if new_frames_detected:
-                    print(f"🆕 New frame detected! Frame count: {last_frame_count}")
+                    show_notice(f"🆕 New frame detected! Frame count: {last_frame_count}")
                 elif time_for_regular_update:
-                    print("⏰ Regular status update (30s interval)")
+                    show_notice("⏰ Regular status update (30s interval)")
+            elif last_status == POST_PENDING and _LAST_POST_ITEM["done"].is_set():
+                # The heartbeat shown as pending has been answered since; show the result
+                last_status = _LAST_POST_ITEM["status"]
+                clear_and_redraw_status(SERVER_HOST, SERVER_PORT, hardware_summary, last_status, last_timestamp,
+                                       current_progress, render_dir, start_frame, end_frame, node_status)
             
             # Check if render is complete
-            if current_progress['progress_percentage'] >= 100.0:
-                print("🎉 Render complete! All frames have been rendered.")
+            if current_progress['progress_percentage'] < 100.0:
+                render_complete = False
+            elif not render_complete:
+                render_complete = True
+                show_notice("🎉 Render complete! All frames have been rendered.")
                 # Send final update with idling status
                 final_status = "idling"
                 data = build_payload(current_progress, final_status)
                 last_status, last_timestamp = post_payload(data)
+                last_post_time = current_time
                 clear_and_redraw_status(SERVER_HOST, SERVER_PORT, hardware_summary, last_status, last_timestamp,
                                        current_progress, render_dir, start_frame, end_frame, final_status)
-                print("✅ Final status sent to server. Monitoring will continue...")
+                show_notice("✅ Final status sent to server. Monitoring will continue...")
             
-            time.sleep(CHECK_INTERVAL)
+            if _RENDER_WATCH["dir"] == render_dir:
+                # Wake up for new files, or when the next regular update is due
+                wait_for_render_change(last_post_time + POST_INTERVAL)
+                next_check = time.monotonic()
+            else:
+                # Don't let the check interval push the regular update past its due time
+                next_check = wait_for_next_tick(next_check, CHECK_INTERVAL, last_post_time + POST_INTERVAL)
             
         except KeyboardInterrupt:
             print("\n\n👋 Mata Sentry render monitor stopped.")
             break
         except Exception as e:
-            print(f"\n❌ Error in monitoring loop: {e}")
-            print("🔄 Continuing monitoring...")
-            time.sleep(CHECK_INTERVAL)
+            show_notice(f"\n❌ Error in monitoring loop: {e}")
+            show_notice("🔄 Continuing monitoring...")
+            next_check = wait_for_next_tick(next_check, CHECK_INTERVAL)
 
 if __name__ == "__main__":
+    # Detect the hardware while the operator answers the prompts
+    start_static_identity_detection()
+    
     # Get user input for render monitoring
     render_dir, start_frame, end_frame = get_user_input()
     